@@ -6,15 +6,23 @@ Provides endpoints to run Monte Carlo simulations with custom parameters.
 """
 
 from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
-import copy
-
+import atexit
+import math
+import orjson
+import os
+import zlib
 import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
 
-from config import DEFAULT_PARAMS, FINNISH_MALE_MORTALITY
+from config import DEFAULT_PARAMS
+from fire_simulator import warm_up_kernel
 from export_data import (
     run_monte_carlo, run_historical_sequence, find_required_portfolio,
-    calculate_legacy_tradeoff, calculate_dynamic_end_age,
+    calculate_legacy_tradeoff, get_dynamic_end_age,
     run_simulation_with_custom_returns
 )
 from stress_scenarios import (
@@ -23,13 +31,163 @@ from stress_scenarios import (
 )
 
 app = Flask(__name__, static_folder='visualization')
-CORS(app)
+
+# Compile the jitted simulation kernel at startup (loads from numba's disk
+# cache after the first ever run) so no request pays the compile latency
+warm_up_kernel()
+
+
+# Open CORS for the dev API. flask_cors computes its headers dynamically
+# per request; for a wildcard-origin API these two static handlers do the
+# same job with far less per-request overhead.
+@app.after_request
+def _cors(response):
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    return response
+
+
+@app.route('/api/<path:_subpath>', methods=['OPTIONS'])
+def _preflight(_subpath):
+    return '', 204
+
+
+def _json_response(payload):
+    """
+    Serialize a response payload with orjson.
+
+    orjson serializes in C and understands NumPy arrays/scalars natively
+    (OPT_SERIALIZE_NUMPY), which is noticeably faster than jsonify's
+    stdlib json for the large percentile/trajectory payloads.
+    """
+    # OPT_NON_STR_KEYS matches stdlib json's coercion of the int age keys
+    # in survival_percentiles
+    return app.response_class(
+        orjson.dumps(
+            payload,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ),
+        mimetype='application/json'
+    )
+
+# Persistent worker pool for the stress-scenario endpoint. Created lazily on
+# first use and reused across requests to amortize process startup cost.
+_scenario_pool = None
+_scenario_pool_lock = threading.Lock()
+
+
+def _worker_init():
+    """
+    Warm each worker process before it takes tasks.
+
+    Importing the simulation modules up front means the first task a worker
+    receives doesn't pay module-import (and numba kernel load) latency.
+    """
+    import fire_simulator
+    import stress_scenarios  # noqa: F401
+    import export_data       # noqa: F401
+    fire_simulator.warm_up_kernel()
+
+
+def _get_scenario_pool() -> ProcessPoolExecutor:
+    global _scenario_pool
+    # Lock the check-then-set: under threaded gunicorn workers two first
+    # requests could otherwise race here and leak a second pool
+    with _scenario_pool_lock:
+        if _scenario_pool is None:
+            _scenario_pool = ProcessPoolExecutor(
+                max_workers=min(len(get_all_scenario_ids()), os.cpu_count() or 1),
+                # Spawn, not fork: this module runs the numba kernel at
+                # import (warm_up_kernel), and forking after the numba
+                # threading layer is initialized leaves workers that never
+                # exit - the atexit join then hangs the parent on shutdown
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_worker_init
+            )
+    return _scenario_pool
+
+
+@atexit.register
+def _shutdown_pool():
+    if _scenario_pool is not None:
+        _scenario_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_one_scenario(scenario_id: str, params: dict, years: int,
+                      num_sims: int, mean: float, std: float) -> tuple:
+    """
+    Worker entry point: generate returns and run one stress scenario.
+
+    Runs in a separate process, so the RNG is seeded deterministically from
+    the scenario id to keep results reproducible regardless of which worker
+    picks up which scenario.
+
+    The (num_sims, years) return matrix is deliberately generated inside the
+    worker rather than in the parent: only the scalar task parameters cross
+    the process boundary, so there is nothing to pickle or share (no
+    shared-memory buffer needed), and generation itself parallelizes across
+    scenarios for free.
+    """
+    rng = np.random.default_rng(zlib.crc32(scenario_id.encode()))
+
+    # float32 matches the Monte Carlo draw path: half the bandwidth through
+    # generation and the batch engine, precision well below sampling noise
+    all_returns = generate_scenario_returns(scenario_id, years, num_sims, mean, std,
+                                            rng=rng, dtype=np.float32)
+    # Same seeded generator for the mortality draw, or repeated requests
+    # would still differ in the death-age statistics
+    results = run_simulation_with_custom_returns(params, all_returns, scenario_id,
+                                                 rng=rng)
+
+    return scenario_id, {
+        'metadata': get_scenario_metadata(scenario_id),
+        'results': results
+    }
 
 
 # =============================================================================
 # HELPER FUNCTIONS - Reduce code duplication in API endpoints
 # =============================================================================
 
+def _fast_clone_defaults() -> dict:
+    """
+    Clone DEFAULT_PARAMS without copy.deepcopy.
+
+    The config is a dict of primitives, flat dicts and lists of flat dicts,
+    so a one-level walk with dict()/list() copies is enough - and an order
+    of magnitude cheaper than deepcopy's recursive introspection, which ran
+    on every API request.
+    """
+    params = {}
+    for key, value in DEFAULT_PARAMS.items():
+        if isinstance(value, dict):
+            params[key] = dict(value)
+        elif isinstance(value, list):
+            params[key] = [dict(item) if isinstance(item, dict) else item
+                           for item in value]
+        else:
+            params[key] = value
+    return params
+
+
+# Field specs for _merge_user_params: (key, cast) pairs walked in a tight
+# loop instead of a cascade of `if 'key' in user_params` branches
+_CORE_FIELDS = (
+    ('starting_portfolio', int),
+    ('annual_expenses', int),
+    ('start_age', int),
+    ('end_age', int),
+)
+_MARKET_FIELDS = (
+    ('expected_return', float),
+    ('inflation', float),
+    ('volatility', float),
+)
+# List parameters are replaced wholesale; nested configs merge key-by-key
+_LIST_FIELDS = ('income_phases', 'windfalls')
+_NESTED_FIELDS = ('emergency_hustle', 'spending_rules', 'mortality')
+
+
 def _merge_user_params(user_params: dict, include_market_params: bool = True) -> dict:
     """
     Merge user parameters with defaults.
@@ -42,45 +200,28 @@ def _merge_user_params(user_params: dict, include_market_params: bool = True) ->
     Returns:
         Merged parameters dict
     """
-    params = copy.deepcopy(DEFAULT_PARAMS)
-
-    # Core parameters
-    if 'starting_portfolio' in user_params:
-        params['starting_portfolio'] = int(user_params['starting_portfolio'])
-    if 'annual_expenses' in user_params:
-        params['annual_expenses'] = int(user_params['annual_expenses'])
-    if 'start_age' in user_params:
-        params['start_age'] = int(user_params['start_age'])
-    if 'end_age' in user_params:
-        params['end_age'] = int(user_params['end_age'])
-
-    # Market parameters (only for Monte Carlo, not historical)
+    params = _fast_clone_defaults()
+
+    for key, cast in _CORE_FIELDS:
+        value = user_params.get(key)
+        if value is not None:
+            params[key] = cast(value)
+
     if include_market_params:
-        if 'expected_return' in user_params:
-            params['expected_return'] = float(user_params['expected_return'])
-        if 'inflation' in user_params:
-            params['inflation'] = float(user_params['inflation'])
-        if 'volatility' in user_params:
-            params['volatility'] = float(user_params['volatility'])
-
-    # List parameters (replace entirely)
-    if 'income_phases' in user_params:
-        params['income_phases'] = user_params['income_phases']
-    if 'windfalls' in user_params:
-        params['windfalls'] = user_params['windfalls']
-
-    # Nested configs (merge keys)
-    if 'emergency_hustle' in user_params:
-        for key, value in user_params['emergency_hustle'].items():
-            params['emergency_hustle'][key] = value
-    if 'spending_rules' in user_params:
-        for key, value in user_params['spending_rules'].items():
-            params['spending_rules'][key] = value
-    if 'mortality' in user_params:
-        if 'mortality' not in params:
-            params['mortality'] = {}
-        for key, value in user_params['mortality'].items():
-            params['mortality'][key] = value
+        for key, cast in _MARKET_FIELDS:
+            value = user_params.get(key)
+            if value is not None:
+                params[key] = cast(value)
+
+    for key in _LIST_FIELDS:
+        value = user_params.get(key)
+        if value is not None:
+            params[key] = value
+
+    for key in _NESTED_FIELDS:
+        value = user_params.get(key)
+        if value is not None:
+            params.setdefault(key, {}).update(value)
 
     return params
 
@@ -111,15 +252,8 @@ def _apply_dynamic_end_age(params: dict, user_params: dict) -> dict:
         tech_scenario = mortality_config.get('tech_scenario', 'moderate')
         start_age = params['start_age']
 
-        # Calculate dynamic end age
-        dynamic_info = calculate_dynamic_end_age(
-            start_age=start_age,
-            mortality_table=FINNISH_MALE_MORTALITY,
-            health_class=health_class,
-            tech_scenario=tech_scenario,
-            survival_threshold=0.01,  # 1% survival threshold
-            hard_cap=110
-        )
+        # Precomputed at import; O(1) lookup per request
+        dynamic_info = get_dynamic_end_age(start_age, health_class, tech_scenario)
 
         # Update end_age with calculated value
         params['end_age'] = dynamic_info['end_age']
@@ -145,7 +279,7 @@ def simulate():
         if '_dynamic_end_age_info' in params:
             result['dynamic_end_age'] = params['_dynamic_end_age_info']
 
-        return jsonify(result)
+        return _json_response(result)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -244,26 +378,41 @@ def fire_assessment():
                 response['years_to_fire'] = None
                 response['projection_note'] = 'Cannot reach FIRE with negative savings and no real returns'
             else:
-                # Project year by year until we hit required portfolio
-                projected_portfolio = portfolio
-                years = 0
+                # Future value of portfolio + annual savings after n years:
+                #   FV(n) = P*(1+r)^n + S*((1+r)^n - 1)/r
+                # Solve FV(n) >= required for n in closed form instead of
+                # stepping year by year
                 max_years = 60  # Safety limit
+                r = real_return
+                years = None
 
-                while projected_portfolio < required and years < max_years:
-                    # Portfolio grows by return, then add savings
-                    projected_portfolio = projected_portfolio * (1 + real_return) + annual_savings
-                    years += 1
-
-                if years >= max_years:
+                if r == 0:
+                    years = max(0, math.ceil((required - portfolio) / annual_savings))
+                else:
+                    # (1+r)^n = (required*r + S) / (P*r + S); non-positive
+                    # numerator/denominator means the target is unreachable
+                    # (portfolio shrinks or asymptotes below the target)
+                    numerator = required * r + annual_savings
+                    denominator = portfolio * r + annual_savings
+                    if numerator > 0 and denominator > 0:
+                        n = math.log(numerator / denominator) / math.log(1 + r)
+                        years = max(0, math.ceil(n - 1e-9))
+
+                if years is None or years >= max_years:
                     response['fire_age'] = None
                     response['years_to_fire'] = None
                     response['projection_note'] = f'FIRE not reachable within {max_years} years'
                 else:
+                    growth = (1 + r) ** years
+                    if r == 0:
+                        projected_portfolio = portfolio + annual_savings * years
+                    else:
+                        projected_portfolio = portfolio * growth + annual_savings * (growth - 1) / r
                     response['fire_age'] = current_age + years
                     response['years_to_fire'] = years
                     response['projected_portfolio_at_fire'] = int(projected_portfolio)
 
-        return jsonify(response)
+        return _json_response(response)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -290,7 +439,7 @@ def simulate_historical():
         params['mortality'] = {'enabled': False}
 
         result = run_historical_sequence(params)
-        return jsonify(result)
+        return _json_response(result)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -321,7 +470,7 @@ def simulate_historical_mortality():
         if '_dynamic_end_age_info' in params:
             result['dynamic_end_age'] = params['_dynamic_end_age_info']
 
-        return jsonify(result)
+        return _json_response(result)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -347,7 +496,7 @@ def legacy_tradeoff():
         num_sims = min(int(user_params.get('num_simulations', 500)), 2000)
 
         result = calculate_legacy_tradeoff(params, num_simulations=num_sims)
-        return jsonify(result)
+        return _json_response(result)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -406,26 +555,19 @@ def stress_scenarios():
         mean = params.get('expected_return', 0.06)
         std = params.get('volatility', 0.15)
 
-        # Run all scenarios
-        scenario_results = {}
-        for scenario_id in get_all_scenario_ids():
-            # Generate returns for this scenario
-            all_returns = generate_scenario_returns(
-                scenario_id, years, num_sims_per_scenario, mean, std
-            )
-
-            # Run simulation with custom returns
-            results = run_simulation_with_custom_returns(
-                params, all_returns, scenario_id
-            )
+        # Scenarios are independent - fan them out across the process pool
+        scenario_ids = get_all_scenario_ids()
+        pool = _get_scenario_pool()
+        futures = [
+            pool.submit(_run_one_scenario, scenario_id, params, years,
+                        num_sims_per_scenario, mean, std)
+            for scenario_id in scenario_ids
+        ]
 
-            # Get scenario metadata
-            metadata = get_scenario_metadata(scenario_id)
+        collected = dict(f.result() for f in as_completed(futures))
 
-            scenario_results[scenario_id] = {
-                'metadata': metadata,
-                'results': results
-            }
+        # Rebuild in canonical scenario order for a stable response layout
+        scenario_results = {sid: collected[sid] for sid in scenario_ids}
 
         elapsed = time.time() - start_time
 
@@ -447,7 +589,7 @@ def stress_scenarios():
         if '_dynamic_end_age_info' in params:
             response['dynamic_end_age'] = params['_dynamic_end_age_info']
 
-        return jsonify(response)
+        return _json_response(response)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -486,20 +628,13 @@ def calculate_end_age():
         health_class = user_params.get('health_class', 'average')
         tech_scenario = user_params.get('tech_scenario', 'moderate')
 
-        result = calculate_dynamic_end_age(
-            start_age=start_age,
-            mortality_table=FINNISH_MALE_MORTALITY,
-            health_class=health_class,
-            tech_scenario=tech_scenario,
-            survival_threshold=0.01,
-            hard_cap=110
-        )
+        result = dict(get_dynamic_end_age(start_age, health_class, tech_scenario))
 
         result['start_age'] = start_age
         result['health_class'] = health_class
         result['tech_scenario'] = tech_scenario
 
-        return jsonify(result)
+        return _json_response(result)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -519,4 +654,6 @@ def static_files(path):
 
 if __name__ == '__main__':
     print("Starting FIRE Simulator API on http://localhost:5000")
-    app.run(debug=True, port=5000)
+    # use_reloader=False: the dev reloader re-imports the module in a child
+    # process, which would double-initialize the worker pool
+    app.run(debug=True, port=5000, use_reloader=False)
@@ -10,8 +10,10 @@ death doesn't change the financial simulation - we run the full simulation
 then categorize outcomes based on sampled death age.
 """
 
-import json
-import random
+import heapq
+import math
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
@@ -19,8 +21,17 @@ from config import (
     DEFAULT_PARAMS, FINNISH_MALE_MORTALITY,
     HEALTH_CLASS_PARAMS, TECH_SCENARIO_PARAMS, AGE_IMPROVEMENT_RATES
 )
-from fire_simulator import run_simulation, SimulationResult
-from scenarios import monte_carlo_returns, historical_sequence_returns, load_historical_returns
+import numpy as np
+import orjson
+
+from fire_simulator import (
+    run_simulation, run_simulation_batch, SimulationResult, SimulationBatch,
+    build_income_schedule, build_windfall_schedule
+)
+from scenarios import historical_sequence_returns, load_historical_returns
+
+# Shared generator for Monte Carlo return draws (PCG64)
+_return_rng = np.random.default_rng()
 
 
 # =============================================================================
@@ -68,6 +79,42 @@ def health_adjusted_mortality(age: int, base_qx: float, health_class: str = "ave
     return base_qx * ratio
 
 
+def _build_base_rate_array(size: int = 150) -> np.ndarray:
+    """Expand the AGE_IMPROVEMENT_RATES buckets into a per-age rate array."""
+    rates = np.full(size, 0.012)  # Default: 1.2% annual improvement
+    for (age_low, age_high), rate in AGE_IMPROVEMENT_RATES.items():
+        rates[age_low:age_high] = rate
+    return rates
+
+
+_BASE_RATE_BY_AGE = _build_base_rate_array()
+
+
+def _base_improvement_rate(age: int) -> float:
+    """Age-specific base mortality improvement rate, one array index."""
+    if 0 <= age < len(_BASE_RATE_BY_AGE):
+        return float(_BASE_RATE_BY_AGE[age])
+    return 0.012
+
+
+@lru_cache(maxsize=None)
+def _tech_factor_table(scenario: str, hard_cap: int = 110) -> np.ndarray:
+    """
+    Precomputed compound improvement factors, entry [age, y] = (1-rate)**y.
+
+    Bakes the AGE_IMPROVEMENT_RATES bucket scan and the pow into a
+    (hard_cap+1, hard_cap+1) table built once per tech scenario with a
+    single broadcasted np.power call.
+    """
+    multiplier = _TECH_MULT.get(scenario, _TECH_MULT['moderate'])
+
+    rate_by_age = np.array(
+        [_base_improvement_rate(age) * multiplier for age in range(hard_cap + 1)]
+    )
+    years = np.arange(hard_cap + 1)
+    return np.power((1.0 - rate_by_age)[:, None], years[None, :])
+
+
 def mortality_improvement_factor(age: int, years_in_future: int, scenario: str = "moderate") -> float:
     """
     Calculate mortality improvement factor for future years.
@@ -86,20 +133,132 @@ def mortality_improvement_factor(age: int, years_in_future: int, scenario: str =
     if years_in_future <= 0:
         return 1.0
 
-    # Get age-specific base improvement rate
-    base_rate = 0.012  # Default: 1.2% annual improvement
-    for (age_low, age_high), rate in AGE_IMPROVEMENT_RATES.items():
-        if age_low <= age < age_high:
-            base_rate = rate
-            break
+    if 0 <= age <= _QX_HARD_CAP and years_in_future <= _QX_HARD_CAP:
+        return float(_tech_factor_table(scenario)[age, years_in_future])
+
+    rate = _base_improvement_rate(age) * _TECH_MULT.get(scenario, _TECH_MULT['moderate'])
+
+    # Compound improvement over time: (1-rate)**years computed as
+    # exp(years * log1p(-rate)), which is cheaper than the pow dispatch
+    # and identical to float precision
+    return math.exp(years_in_future * math.log1p(-rate))
+
+
+# Highest age any caller asks about; also bounds the precomputed qx tables
+_QX_HARD_CAP = 110
+
+# Health-class and tech-scenario parameters flattened to plain tuples/floats
+# so the qx build loop reads locals instead of chasing nested dicts
+_HEALTH = {
+    name: (p['base_ratio'], p['convergence_ratio'], p.get('convergence_age', 100))
+    for name, p in HEALTH_CLASS_PARAMS.items()
+}
+_TECH_MULT = {
+    name: p['rate_multiplier'] for name, p in TECH_SCENARIO_PARAMS.items()
+}
+
+
+def _build_base_qx_array(mortality_table: Dict[int, float]) -> np.ndarray:
+    """
+    Flatten a mortality dict into a dense base-qx array indexed by age.
+
+    Boundary behavior is pre-baked: ages below the table clamp to its
+    youngest entry, ages above it get the 500-per-1000 very-old-age rate.
+    Replaces per-call hash lookups and min()/max() scans with one array
+    index.
+    """
+    min_age = min(mortality_table.keys())
+    arr = np.full(_QX_HARD_CAP + 1, 500.0)  # 50% annual death rate when very old
+    arr[:min_age] = mortality_table[min_age]
+    for age, qx in mortality_table.items():
+        if age <= _QX_HARD_CAP:
+            arr[age] = qx
+    return arr
+
+
+_FINNISH_MALE_QX_ARR = _build_base_qx_array(FINNISH_MALE_MORTALITY)
+
+
+def _compute_qx(
+    age: int,
+    mortality_table: Dict[int, float],
+    health_class: str,
+    tech_scenario: str,
+    years_from_retirement: int
+) -> float:
+    """
+    Compute an adjusted qx from scratch (slow path / table builder).
+
+    Applies both health adjustment and technology improvement.
+    """
+    # Get base rate from the dense per-age array (standard table) or the
+    # raw dict with clamping (anything else)
+    if mortality_table is FINNISH_MALE_MORTALITY and 0 <= age <= _QX_HARD_CAP:
+        base_qx = _FINNISH_MALE_QX_ARR[age]
+    elif age in mortality_table:
+        base_qx = mortality_table[age]
+    else:
+        min_age = min(mortality_table.keys())
+        if age < min_age:
+            base_qx = mortality_table[min_age]
+        else:
+            base_qx = 500  # 50% annual death rate for very old ages
+
+    # Apply health adjustment (age-varying), inlined from
+    # health_adjusted_mortality with the class params pre-flattened
+    base_ratio, convergence_ratio, convergence_age = _HEALTH.get(
+        health_class, _HEALTH['average'])
+    base_age = 45
+    if age <= base_age:
+        ratio = base_ratio
+    elif age >= convergence_age:
+        ratio = convergence_ratio
+    else:
+        ratio = base_ratio + (convergence_ratio - base_ratio) * (
+            (age - base_age) / (convergence_age - base_age))
+
+    # Apply tech improvement (time-varying)
+    tech_factor = mortality_improvement_factor(age, years_from_retirement, tech_scenario)
+    return base_qx * ratio * tech_factor
+
+
+def build_qx_matrix(
+    start_age: int,
+    hard_cap: int,
+    mortality_table: Dict[int, float],
+    health_class: str = "average",
+    tech_scenario: str = "moderate"
+) -> np.ndarray:
+    """
+    Precompute adjusted qx for every (age, years_from_retirement) pair.
 
-    # Apply scenario multiplier
-    scenario_params = TECH_SCENARIO_PARAMS.get(scenario, TECH_SCENARIO_PARAMS['moderate'])
-    rate = base_rate * scenario_params['rate_multiplier']
+    Returns a contiguous (hard_cap+1, hard_cap-start_age+1) float64 array
+    where entry [age, y] holds the health- and tech-adjusted mortality rate
+    (per 1,000) at `age`, `y` years into the future. Building it runs the
+    full adjustment math once per cell; afterwards every lookup is a plain
+    array index.
+    """
+    years = hard_cap - start_age + 1
+    qx_matrix = np.empty((hard_cap + 1, years), dtype=np.float64)
+    for age in range(hard_cap + 1):
+        for y in range(years):
+            qx_matrix[age, y] = _compute_qx(
+                age, mortality_table, health_class, tech_scenario, y
+            )
+    return qx_matrix
+
+
+@lru_cache(maxsize=None)
+def _qx_table_for(health_class: str, tech_scenario: str) -> np.ndarray:
+    """
+    Cached full qx matrix for a (health_class, tech_scenario) pair.
 
-    # Compound improvement over time
-    # Each year, mortality is reduced by the improvement rate
-    return (1 - rate) ** years_in_future
+    There are only nine combinations, so each table (built over ages and
+    future-years 0.._QX_HARD_CAP) is computed at most once per process.
+    """
+    return build_qx_matrix(
+        0, _QX_HARD_CAP, FINNISH_MALE_MORTALITY, health_class, tech_scenario
+    )
 
 
 def _get_qx(
@@ -112,7 +271,9 @@ def _get_qx(
     """
     Get death probability (qx per 1,000) for a given age with adjustments.
 
-    Applies both health adjustment and technology improvement.
+    Reads the precomputed (age, years_from_retirement) table for the
+    standard mortality table; non-standard tables or out-of-range ages
+    fall back to computing the adjustment directly.
 
     Args:
         age: Current age
@@ -124,25 +285,59 @@ def _get_qx(
     Returns:
         Adjusted mortality rate (per 1000)
     """
-    # Get base rate from table
-    if age in mortality_table:
-        base_qx = mortality_table[age]
-    else:
-        min_age = min(mortality_table.keys())
-        max_age = max(mortality_table.keys())
-        if age < min_age:
-            base_qx = mortality_table[min_age]
-        else:
-            base_qx = 500  # 50% annual death rate for very old ages
+    if (mortality_table is FINNISH_MALE_MORTALITY
+            and 0 <= age <= _QX_HARD_CAP
+            and 0 <= years_from_retirement <= _QX_HARD_CAP):
+        return _qx_cached(age, health_class, tech_scenario, years_from_retirement)
 
-    # Apply health adjustment (age-varying)
-    adjusted_qx = health_adjusted_mortality(age, base_qx, health_class)
+    return _compute_qx(age, mortality_table, health_class, tech_scenario,
+                       years_from_retirement)
 
-    # Apply tech improvement (time-varying)
-    tech_factor = mortality_improvement_factor(age, years_from_retirement, tech_scenario)
-    adjusted_qx = adjusted_qx * tech_factor
 
-    return adjusted_qx
+@lru_cache(maxsize=None)
+def _qx_cached(
+    age: int, health_class: str, tech_scenario: str, years_from_retirement: int
+) -> float:
+    """
+    Memoized scalar qx read against the standard table.
+
+    Only ~12k (age, years) tuples exist per health/tech combination, so
+    repeat scalar callers get a plain cached float instead of paying the
+    NumPy indexing and boxing on every call.
+    """
+    return float(_qx_table_for(health_class, tech_scenario)[age, years_from_retirement])
+
+
+@dataclass(frozen=True)
+class MortalityCurve:
+    """
+    Shared work buffers for one (start_age, end_age, health, tech) slice.
+
+    The samplers and survival summaries all derive from the same adjusted
+    qx diagonal; building the hazard and survival arrays once and sharing
+    them removes the redundant per-function rebuilds.
+    """
+    start_age: int
+    end_age: int
+    qx: np.ndarray        # adjusted rates per 1,000 along the retirement diagonal
+    mu: np.ndarray        # annual hazards, -log(1 - qx/1000)
+    cum_mu: np.ndarray    # cumulative hazard through each age
+    survival: np.ndarray  # [k] = P(survive ages start..start+k-1), leading 1.0
+
+
+@lru_cache(maxsize=None)
+def _mortality_curve(
+    start_age: int, end_age: int, health_class: str, tech_scenario: str
+) -> MortalityCurve:
+    """Build (and memoize) the mortality curve against the standard table."""
+    ages = np.arange(start_age, end_age + 1)
+    qx = _qx_table_for(health_class, tech_scenario)[ages, ages - start_age]
+    mu = -np.log1p(-qx / 1000.0)
+    cum_mu = np.cumsum(mu)
+    survival = np.empty(len(qx) + 1)
+    survival[0] = 1.0
+    np.exp(-cum_mu, out=survival[1:])
+    return MortalityCurve(start_age, end_age, qx, mu, cum_mu, survival)
 
 
 def sample_death_age(
@@ -165,16 +360,75 @@ def sample_death_age(
     Returns:
         Age of death, or None if survived to end_age
     """
-    for age in range(start_age, end_age + 1):
-        years_from_retirement = age - start_age
-        qx = _get_qx(age, mortality_table, health_class, tech_scenario, years_from_retirement)
+    if (mortality_table is FINNISH_MALE_MORTALITY
+            and 0 <= start_age and end_age <= _QX_HARD_CAP):
+        # Invert the shared cumulative hazard against one exponential draw
+        curve = _mortality_curve(start_age, end_age, health_class, tech_scenario)
+        e = -math.log(_return_rng.random())
+        idx = int(np.searchsorted(curve.cum_mu, e))
+        if idx >= len(curve.qx):
+            return None  # Survived to end_age
+        return start_age + idx
+
+    qx_vec = np.array([
+        _get_qx(age, mortality_table, health_class, tech_scenario, age - start_age)
+        for age in range(start_age, end_age + 1)
+    ])
+
+    # One vectorized uniform block instead of a random.random() call per
+    # age; first age whose draw lands under its death probability wins
+    hit = _return_rng.random(len(qx_vec)) < qx_vec / 1000.0
+    if not hit.any():
+        return None  # Survived to end_age
+    return int(start_age + hit.argmax())
+
+
+def sample_death_ages_batch(
+    num_simulations: int,
+    start_age: int,
+    end_age: int,
+    mortality_table: Dict[int, float],
+    health_class: str = "average",
+    tech_scenario: str = "moderate",
+    rng: Optional[np.random.Generator] = None
+) -> List[Optional[int]]:
+    """
+    Sample death ages for many simulations in one vectorized draw.
+
+    Builds the death-age CDF from the adjusted mortality curve once, then
+    inverts it for all simulations with a single uniform draw plus
+    searchsorted - equivalent to calling sample_death_age() per simulation
+    but without N Python-level walks over the mortality table.
 
-        death_prob = qx / 1000
+    Returns:
+        List of death ages (None where the simulation survived to end_age)
+    """
+    # Constant-force-of-mortality form: the hazard is mu = -log(1 - qx)
+    # per year, survival through age i is exp(-cum_mu[i]), and a death
+    # falls at the first age whose cumulative hazard exceeds an
+    # exponential draw -log(U). Equivalent to inverting the discrete CDF
+    # but accumulates in log space, which stays exact at the extreme old
+    # ages where qx approaches 50%
+    if (mortality_table is FINNISH_MALE_MORTALITY
+            and 0 <= start_age and end_age <= _QX_HARD_CAP):
+        cum_mu = _mortality_curve(start_age, end_age, health_class, tech_scenario).cum_mu
+    else:
+        qx = np.array([
+            _get_qx(age, mortality_table, health_class, tech_scenario, age - start_age)
+            for age in range(start_age, end_age + 1)
+        ]) / 1000.0
+        cum_mu = np.cumsum(-np.log1p(-qx))
 
-        if random.random() < death_prob:
-            return age
+    if rng is None:
+        rng = _return_rng
+    e = -np.log(rng.random(num_simulations))
+    death_idx = np.searchsorted(cum_mu, e)
 
-    return None  # Survived to end_age
+    # Convert in C via tolist(), then patch the (rare) survivors to None
+    death_ages = (start_age + death_idx).tolist()
+    for i in np.nonzero(death_idx >= len(cum_mu))[0]:
+        death_ages[i] = None
+    return death_ages
 
 
 def calculate_survival_probability(
@@ -190,44 +444,93 @@ def calculate_survival_probability(
     This is the cumulative survival probability:
     P(survive to end) = Product of (1 - qx/1000) for each year
     """
-    survival_prob = 1.0
-    for age in range(start_age, end_age + 1):
-        years_from_retirement = age - start_age
-        qx = _get_qx(age, mortality_table, health_class, tech_scenario, years_from_retirement)
-        death_prob = qx / 1000
-        survival_prob *= (1 - death_prob)
-    return survival_prob
+    alive = _survival_curve(start_age, end_age, mortality_table,
+                            health_class, tech_scenario)
+    return float(alive[-1])
 
 
-def get_life_expectancy(
+def _survival_curve(
     start_age: int,
+    end_age: int,
     mortality_table: Dict[int, float],
+    health_class: str,
+    tech_scenario: str
+) -> np.ndarray:
+    """
+    Cumulative survival probabilities over ages start_age..end_age.
+
+    Returns an array of length (end_age - start_age + 2) where entry [k]
+    is P(survive mortality at ages start_age..start_age+k-1); entry [0]
+    is 1.0 and entry [-1] is survival through end_age. One cumprod
+    replaces the per-age Python loops the mortality summaries shared.
+    """
+    if (mortality_table is FINNISH_MALE_MORTALITY
+            and 0 <= start_age and end_age <= _QX_HARD_CAP):
+        return _mortality_curve(start_age, end_age, health_class, tech_scenario).survival
+
+    qx = np.array([
+        _get_qx(age, mortality_table, health_class, tech_scenario, age - start_age)
+        for age in range(start_age, end_age + 1)
+    ])
+
+    # Constant-force form: accumulate the hazard mu = -log(1 - qx/1000)
+    # and exponentiate, rather than multiplying survival factors directly
+    alive = np.empty(len(qx) + 1)
+    alive[0] = 1.0
+    np.exp(np.cumsum(np.log1p(-qx / 1000.0)), out=alive[1:])
+    return alive
+
+
+@lru_cache(maxsize=None)
+def _life_expectancy_cached(
+    start_age: int, health_class: str, tech_scenario: str, max_age: int
+) -> float:
+    """Memoized life expectancy against the standard mortality table."""
+    # Expected years = sum of P(alive at each age)
+    alive = _survival_curve(start_age, max_age, FINNISH_MALE_MORTALITY,
+                            health_class, tech_scenario)
+    return float(alive[:-1].sum())
+
+
+def get_life_expectancy(
+    start_age: int,
+    mortality_table: Dict[int, float] = None,
     health_class: str = "average",
     tech_scenario: str = "moderate",
     max_age: int = 110
 ) -> float:
     """
     Calculate expected remaining years of life from start_age.
-    """
-    survival_prob = 1.0
-    expected_years = 0.0
 
-    for age in range(start_age, max_age + 1):
-        years_from_retirement = age - start_age
-        qx = _get_qx(age, mortality_table, health_class, tech_scenario, years_from_retirement)
-        death_prob = qx / 1000
+    Deterministic in its arguments, so results against the standard table
+    (mortality_table=None) are memoized - scenario sweeps that vary only
+    financial parameters get the mortality math for free.
+    """
+    if mortality_table is None or mortality_table is FINNISH_MALE_MORTALITY:
+        return _life_expectancy_cached(start_age, health_class, tech_scenario, max_age)
 
-        # Expected years = sum of P(alive at each age)
-        expected_years += survival_prob
+    alive = _survival_curve(start_age, max_age, mortality_table,
+                            health_class, tech_scenario)
+    return float(alive[:-1].sum())
 
-        survival_prob *= (1 - death_prob)
 
-    return expected_years
+@lru_cache(maxsize=None)
+def _dynamic_end_age_cached(
+    start_age: int,
+    health_class: str,
+    tech_scenario: str,
+    survival_threshold: float,
+    hard_cap: int
+) -> dict:
+    """Memoized dynamic end-age info against the standard mortality table."""
+    alive = _survival_curve(start_age, hard_cap, FINNISH_MALE_MORTALITY,
+                            health_class, tech_scenario)
+    return _summarize_survival_curve(alive, start_age, survival_threshold, hard_cap)
 
 
 def calculate_dynamic_end_age(
     start_age: int,
-    mortality_table: Dict[int, float],
+    mortality_table: Dict[int, float] = None,
     health_class: str = "average",
     tech_scenario: str = "moderate",
     survival_threshold: float = 0.01,
@@ -241,9 +544,12 @@ def calculate_dynamic_end_age(
     the simulation runs long enough to capture realistic longevity scenarios
     for each health/tech combination.
 
+    Results against the standard table (mortality_table=None) are memoized.
+
     Args:
         start_age: Age at retirement/simulation start
-        mortality_table: Dict of age -> qx (death probability per 1,000)
+        mortality_table: Dict of age -> qx (death probability per 1,000),
+                         or None for the standard Finnish table
         health_class: "excellent", "average", or "impaired"
         tech_scenario: "conservative", "moderate", or "optimistic"
         survival_threshold: End simulation when survival drops below this (default 0.01 = 1%)
@@ -256,45 +562,94 @@ def calculate_dynamic_end_age(
             - life_expectancy: Expected years of life from start_age
             - survival_percentiles: Survival probability at key ages (75, 85, 90, 95, 100, 105)
     """
-    survival_prob = 1.0
-    expected_years = 0.0
-    calculated_end_age = hard_cap
-
-    # Track survival at key ages for display
-    key_ages = [75, 80, 85, 90, 95, 100, 105, 110]
-    survival_percentiles = {}
+    if mortality_table is None or mortality_table is FINNISH_MALE_MORTALITY:
+        return _dynamic_end_age_cached(start_age, health_class, tech_scenario,
+                                       survival_threshold, hard_cap)
 
-    for age in range(start_age, hard_cap + 1):
-        years_from_retirement = age - start_age
-        qx = _get_qx(age, mortality_table, health_class, tech_scenario, years_from_retirement)
-        death_prob = qx / 1000
+    alive = _survival_curve(start_age, hard_cap, mortality_table,
+                            health_class, tech_scenario)
+    return _summarize_survival_curve(alive, start_age, survival_threshold, hard_cap)
 
-        # Track survival at key ages
-        if age in key_ages:
-            survival_percentiles[age] = round(survival_prob * 100, 1)
 
-        # Accumulate expected years
-        expected_years += survival_prob
+def _summarize_survival_curve(
+    alive: np.ndarray, start_age: int, survival_threshold: float, hard_cap: int
+) -> dict:
+    """Build the end-age summary dict from a cumulative survival curve."""
+    # alive[k] = P(survive mortality at ages start_age..start_age+k-1)
 
-        # Apply mortality for this year
-        survival_prob *= (1 - death_prob)
+    # Survival at key ages for display (probability before that year's
+    # mortality applies)
+    key_ages = [75, 80, 85, 90, 95, 100, 105, 110]
+    survival_percentiles = {
+        age: round(float(alive[age - start_age]) * 100, 1)
+        for age in key_ages
+        if start_age <= age <= hard_cap
+    }
 
-        # Check if we've dropped below threshold
-        if survival_prob < survival_threshold and calculated_end_age == hard_cap:
-            calculated_end_age = age
-            # Continue loop to calculate full life expectancy and all percentiles
+    # First age whose post-mortality survival drops below the threshold
+    below = np.nonzero(alive[1:] < survival_threshold)[0]
+    calculated_end_age = int(start_age + below[0]) if below.size else hard_cap
 
     # Ensure end_age is at least start_age + 10 (minimum reasonable simulation)
     calculated_end_age = max(calculated_end_age, start_age + 10)
 
     return {
         'end_age': calculated_end_age,
-        'survival_at_end': round(survival_prob * 100, 2),
-        'life_expectancy': round(expected_years, 1),
+        'survival_at_end': round(float(alive[-1]) * 100, 2),
+        'life_expectancy': round(float(alive[:-1].sum()), 1),
         'survival_percentiles': survival_percentiles
     }
 
 
+def _build_end_age_table() -> dict:
+    """
+    Precompute dynamic end ages for every plausible input combination.
+
+    The inputs form a tiny discrete space (start ages 30-70 times 3 health
+    classes times 3 tech scenarios), so we pay the cost once at import and
+    serve requests with an O(1) dict lookup.
+    """
+    table = {}
+    for start_age in range(30, 71):
+        for health_class in HEALTH_CLASS_PARAMS:
+            for tech_scenario in TECH_SCENARIO_PARAMS:
+                table[(start_age, health_class, tech_scenario)] = calculate_dynamic_end_age(
+                    start_age=start_age,
+                    mortality_table=FINNISH_MALE_MORTALITY,
+                    health_class=health_class,
+                    tech_scenario=tech_scenario,
+                    survival_threshold=0.01,
+                    hard_cap=110
+                )
+    return table
+
+
+_END_AGE_TABLE = _build_end_age_table()
+
+
+def get_dynamic_end_age(start_age: int, health_class: str, tech_scenario: str) -> dict:
+    """
+    Look up the dynamic end-age info for the given mortality settings.
+
+    Hits the precomputed table for the standard input space; off-table
+    combinations (unusual start ages) fall back to computing on demand
+    and are cached for subsequent requests.
+    """
+    key = (start_age, health_class, tech_scenario)
+    info = _END_AGE_TABLE.get(key)
+    if info is None:
+        info = calculate_dynamic_end_age(
+            start_age=start_age,
+            mortality_table=FINNISH_MALE_MORTALITY,
+            health_class=health_class,
+            tech_scenario=tech_scenario,
+            survival_threshold=0.01,
+            hard_cap=110
+        )
+        _END_AGE_TABLE[key] = info
+    return info
+
+
 # Legacy compatibility function
 def _get_legacy_health_class(healthy_factor: float) -> str:
     """Map old healthy_lifestyle_factor to new health_class."""
@@ -359,7 +714,8 @@ def _calculate_theoretical_mortality_stats(
 
 
 def _classify_mortality_outcomes(
-    results: List,
+    survived_flags: List[bool],
+    ruin_ages: List[Optional[int]],
     death_ages: List[Optional[int]],
     mortality_enabled: bool
 ) -> dict:
@@ -371,41 +727,42 @@ def _classify_mortality_outcomes(
     - died_with_money: Died naturally before running out
     - ran_out_of_money: Portfolio hit zero while still alive (true failure)
 
+    Args:
+        survived_flags: Per-simulation survival flag (portfolio never hit zero)
+        ruin_ages: Per-simulation ruin age (None/-1 if survived)
+        death_ages: Per-simulation sampled death age (None if lived to end)
+        mortality_enabled: Whether mortality modeling was on
+
     Returns:
         Dict with outcome counts and rates
     """
-    num_simulations = len(results)
-    failures = [r for r in results if not r.survived]
-    survived_count = num_simulations - len(failures)
+    survived = np.asarray(survived_flags, dtype=bool)
+    num_simulations = survived.size
+    survived_count = int(survived.sum())
+    failure_count = num_simulations - survived_count
 
     if mortality_enabled:
-        survived_to_end_count = 0
-        died_with_money = 0
-        ran_out_of_money = 0
-
-        for result, death_age in zip(results, death_ages):
-            if result.survived:
-                if death_age is None:
-                    survived_to_end_count += 1
-                else:
-                    died_with_money += 1
-            else:
-                ruin_age = result.ruin_age
-                if death_age is not None and death_age < ruin_age:
-                    died_with_money += 1  # Death "saved" them
-                else:
-                    ran_out_of_money += 1  # True failure
+        death = np.array([-1 if d is None else d for d in death_ages])
+        ruin = np.array([-1 if r is None else r for r in ruin_ages])
+        died_before_end = death >= 0
+
+        # Death before ruin "saves" an otherwise failed path
+        saved_by_death = ~survived & died_before_end & (death < ruin)
+
+        survived_to_end_count = int((survived & ~died_before_end).sum())
+        died_with_money = int(((survived & died_before_end) | saved_by_death).sum())
+        ran_out_of_money = int((~survived & ~saved_by_death).sum())
 
         real_failure_rate = ran_out_of_money / num_simulations
 
-        actual_deaths = [d for d in death_ages if d is not None]
-        avg_death_age = sum(actual_deaths) / len(actual_deaths) if actual_deaths else None
-        death_before_end_rate = len(actual_deaths) / num_simulations
+        death_count = int(died_before_end.sum())
+        avg_death_age = float(death[died_before_end].mean()) if death_count else None
+        death_before_end_rate = death_count / num_simulations
     else:
         survived_to_end_count = survived_count
         died_with_money = 0
-        ran_out_of_money = len(failures)
-        real_failure_rate = len(failures) / num_simulations
+        ran_out_of_money = failure_count
+        real_failure_rate = failure_count / num_simulations
         avg_death_age = None
         death_before_end_rate = 0.0
 
@@ -433,20 +790,15 @@ def calculate_percentile_trajectories(
 
     # Get ages from first result (all should have same ages)
     ages = results[0].ages
-    num_years = len(ages)
 
-    trajectories = {"ages": ages}
+    # Stack all trajectories once and take every percentile column-wise in
+    # a single C call; method='lower' matches the old int(len*p/100) index
+    arr = np.asarray([r.portfolio_values for r in results], dtype=np.float64)
+    pct = np.percentile(arr, percentiles, axis=0, method='lower')
 
-    for p in percentiles:
-        trajectory = []
-        for year_idx in range(num_years):
-            # Get all portfolio values at this year
-            values = sorted([r.portfolio_values[year_idx] for r in results])
-            # Calculate percentile
-            idx = int(len(values) * p / 100)
-            idx = min(idx, len(values) - 1)
-            trajectory.append(values[idx])
-        trajectories[f"p{p}"] = trajectory
+    trajectories = {"ages": ages}
+    for i, p in enumerate(percentiles):
+        trajectories[f"p{p}"] = pct[i].tolist()
 
     return trajectories
 
@@ -462,11 +814,12 @@ def get_failure_examples(
     """
     failures = [r for r in results if not r.survived]
 
-    # Sort by ruin age (earliest failures first - most interesting)
-    failures.sort(key=lambda r: r.ruin_age or 999)
+    # Only the earliest failures are reported (most interesting) - heap
+    # selection of the top K instead of sorting every failure
+    failures = heapq.nsmallest(max_examples, failures, key=lambda r: r.ruin_age or 999)
 
     examples = []
-    for r in failures[:max_examples]:
+    for r in failures:
         examples.append({
             "ruin_age": r.ruin_age,
             "trajectory": r.portfolio_values,
@@ -494,11 +847,11 @@ def get_close_call_examples(
 
     for r in results:
         if r.survived:
-            min_value = min(r.portfolio_values)
-            if min_value < threshold:
+            # The simulation tracks its running minimum, so no rescan here
+            if r.min_value < threshold:
                 close_calls.append({
-                    "min_value": min_value,
-                    "min_age": r.ages[r.portfolio_values.index(min_value)],
+                    "min_value": r.min_value,
+                    "min_age": r.min_age,
                     "final_portfolio": r.final_portfolio,
                     "trajectory": r.portfolio_values,
                     "ages": r.ages,
@@ -513,6 +866,224 @@ def get_close_call_examples(
     return close_calls[:max_examples]
 
 
+def calculate_percentile_trajectories_batch(
+    batch: SimulationBatch,
+    percentiles: List[int] = [5, 10, 15, 25, 50, 75, 95]
+) -> Dict[str, List[float]]:
+    """
+    Calculate portfolio value at each percentile for each age (SoA batch).
+
+    Same output shape as calculate_percentile_trajectories, but computes
+    every percentile for every year in a single np.percentile call over the
+    trajectory matrix (selection-based, no per-year sorting).
+    """
+    if batch.num_paths == 0:
+        return {}
+
+    trajectories = {"ages": batch.ages.tolist()}
+
+    pctiles = np.percentile(
+        batch.portfolios.astype(np.float64), percentiles, axis=0, method='lower'
+    )
+    for p, row in zip(percentiles, pctiles):
+        trajectories[f"p{p}"] = row.tolist()
+
+    return trajectories
+
+
+def get_failure_examples_batch(
+    batch: SimulationBatch,
+    max_examples: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Get example trajectories from failed simulations (SoA batch).
+
+    Returns list of failures with their trajectories and ruin age,
+    earliest failures first.
+    """
+    ages = batch.ages.tolist()
+
+    # Sort by ruin age (earliest failures first - most interesting); argsort
+    # on the sentinel array beats a Python comparator, and only the chosen
+    # rows are materialized
+    failed_idx = np.nonzero(batch.ruin_age >= 0)[0]
+    ruin_ages = batch.ruin_age[failed_idx]
+    if ruin_ages.size > max_examples:
+        # O(K) selection of the K earliest ruins, then sort just those
+        keep = np.argpartition(ruin_ages, max_examples)[:max_examples]
+        failed_idx = failed_idx[keep]
+        ruin_ages = ruin_ages[keep]
+    chosen = failed_idx[np.argsort(ruin_ages, kind='stable')]
+
+    examples = []
+    for i in chosen:
+        examples.append({
+            "ruin_age": int(batch.ruin_age[i]),
+            "trajectory": batch.portfolios[i].tolist(),
+            "ages": ages,
+            "hustle_activated": bool(batch.hustle_activated[i]),
+            "hustle_activation_age": (
+                int(batch.hustle_activation_age[i])
+                if batch.hustle_activation_age[i] >= 0 else None
+            ),
+            "spending_reduced": bool(batch.spending_reduced[i]),
+            "spending_went_lean": bool(batch.spending_went_lean[i])
+        })
+
+    return examples
+
+
+def get_close_call_examples_batch(
+    batch: SimulationBatch,
+    threshold: float = 200_000,
+    max_examples: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Get examples that survived but got dangerously low (SoA batch).
+
+    "Close calls" = survived but minimum portfolio dropped below threshold.
+    """
+    ages = batch.ages.tolist()
+
+    # The kernel tracks each row's minimum during evolution, so selection
+    # here never touches the trajectory matrix; only the chosen rows are
+    # materialized as Python lists
+    survivor_idx = np.nonzero(batch.ruin_age < 0)[0]
+    if survivor_idx.size == 0:
+        return []
+
+    min_values = batch.path_min[survivor_idx]
+
+    below = np.nonzero(min_values < threshold)[0]
+    # Sort by how close they got to ruin, keep only the worst few
+    below = below[np.argsort(min_values[below], kind='stable')][:max_examples]
+
+    close_calls = []
+    for j in below:
+        i = int(survivor_idx[j])
+        trajectory = batch.portfolios[i]
+        close_calls.append({
+            "min_value": float(min_values[j]),
+            "min_age": ages[int(batch.path_min_idx[i])],
+            "final_portfolio": float(trajectory[-1]),
+            "trajectory": trajectory.tolist(),
+            "ages": ages,
+            "hustle_activated": bool(batch.hustle_activated[i]),
+            "spending_reduced": bool(batch.spending_reduced[i]),
+            "spending_went_lean": bool(batch.spending_went_lean[i])
+        })
+
+    return close_calls
+
+
+# Memoized results of find_required_portfolio, keyed by every parameter
+# that affects the answer. The last answer also seeds a warm-start bracket
+# for similar (but not identical) queries.
+_required_portfolio_cache: Dict[tuple, int] = {}
+_last_required_portfolio: Optional[int] = None
+
+# Memoized success-rate evaluations, keyed by params plus the starting
+# portfolio rounded to a €5k bin. Success rate is monotone in portfolio, so
+# bin-level reuse is safe for bisection purposes - but only against one set
+# of return draws, so the cache is cleared whenever a fresh shared return
+# matrix is drawn.
+_success_rate_cache: Dict[tuple, float] = {}
+_SUCCESS_RATE_BIN = 5_000
+
+
+def _sim_params_key(base_params: dict) -> tuple:
+    """Build a hashable key from the simulation-relevant parameters."""
+    return (
+        int(base_params.get('annual_expenses', 0)),
+        base_params['start_age'],
+        base_params['end_age'],
+        round(base_params.get('expected_return', 0.0), 3),
+        round(base_params.get('volatility', 0.0), 3),
+        round(base_params.get('inflation', 0.0), 3),
+        tuple((p['start_age'], p['end_age'], p['amount'])
+              for p in base_params.get('income_phases') or []),
+        tuple((w['age'], w['amount'])
+              for w in base_params.get('windfalls') or []),
+        tuple(sorted((base_params.get('emergency_hustle') or {}).items())),
+        tuple(sorted((base_params.get('spending_rules') or {}).items())),
+    )
+
+
+def _required_portfolio_key(base_params: dict, target_certainty: float) -> tuple:
+    return _sim_params_key(base_params) + (round(target_certainty, 3),)
+
+
+def _success_rate_at(
+    base_params: dict,
+    portfolio: int,
+    num_simulations: int,
+    all_returns: np.ndarray = None
+) -> float:
+    """
+    Run one Monte Carlo evaluation at a given starting portfolio.
+
+    Evaluations are memoized per €5k portfolio bin, so repeated probes from
+    the bisection don't rerun the same simulation once the bracket tightens.
+    """
+    key = _sim_params_key(base_params) + (
+        int(portfolio) // _SUCCESS_RATE_BIN, num_simulations
+    )
+    cached = _success_rate_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Shallow override: run_monte_carlo never mutates nested params, so a
+    # one-level copy is enough - no deepcopy per probe
+    test_params = {**base_params, 'starting_portfolio': portfolio}
+    result = run_monte_carlo(test_params, num_simulations, all_returns=all_returns)
+    success_rate = result['summary']['success_rate']
+
+    _success_rate_cache[key] = success_rate
+    return success_rate
+
+
+def _break_even_portfolios(all_returns: np.ndarray, base_params: dict) -> np.ndarray:
+    """
+    Closed-form minimum surviving starting portfolio for each return path.
+
+    With emergency hustle and spending rules disabled the yearly cash flows
+    don't depend on the portfolio, so each path is a linear recurrence in
+    the starting value: discounting every net withdrawal (and windfall) by
+    the cumulative growth up to its year gives the exact portfolio below
+    which that path ruins. Only valid when both behavioral rules are off.
+    """
+    start_age = base_params['start_age']
+    years = base_params['end_age'] - start_age
+    inflation_rate = base_params.get('inflation', 0.0)
+
+    ages_after = start_age + 1 + np.arange(years)
+    inflation_multipliers = np.empty(years, dtype=np.float64)
+    if years > 0:
+        inflation_multipliers[0] = 1.0
+        np.cumprod(np.full(years - 1, 1.0 + inflation_rate), out=inflation_multipliers[1:])
+
+    income = (
+        build_income_schedule(ages_after, base_params.get('income_phases') or [])
+        * inflation_multipliers
+    )
+    windfalls = build_windfall_schedule(ages_after, base_params.get('windfalls') or [])
+    net_withdrawals = np.maximum(
+        base_params['annual_expenses'] * inflation_multipliers - income, 0.0
+    )
+
+    # Cumulative growth through year t, and through the year before
+    # (windfalls land before the year's return is applied)
+    growth = np.cumprod(1.0 + all_returns.astype(np.float64), axis=1)
+    growth_before = np.empty_like(growth)
+    growth_before[:, 0] = 1.0
+    growth_before[:, 1:] = growth[:, :-1]
+
+    # Net cash need discounted to t=0; the running maximum of its cumulative
+    # sum is the exact break-even starting portfolio for the path
+    discounted = net_withdrawals / growth - windfalls / growth_before
+    return np.maximum(np.cumsum(discounted, axis=1).max(axis=1), 0.0)
+
+
 def find_required_portfolio(
     base_params: dict,
     target_certainty: float,
@@ -521,6 +1092,10 @@ def find_required_portfolio(
     """
     Binary search to find minimum portfolio for target success rate.
 
+    Results are memoized, and the bisection bracket is warm-started around
+    the most recent answer (users typically probe nearby parameter values),
+    which roughly halves the number of inner Monte Carlo runs.
+
     Args:
         base_params: Simulation parameters (portfolio value will be overridden)
         target_certainty: Target success rate (e.g., 0.95 for 95%)
@@ -529,7 +1104,12 @@ def find_required_portfolio(
     Returns:
         Minimum portfolio needed to achieve target certainty
     """
-    import copy
+    global _last_required_portfolio
+
+    key = _required_portfolio_key(base_params, target_certainty)
+    cached = _required_portfolio_cache.get(key)
+    if cached is not None:
+        return cached
 
     low = base_params.get('starting_portfolio', 0)
     # Upper bound: 50x annual expenses or 5x current portfolio
@@ -539,20 +1119,56 @@ def find_required_portfolio(
         2_000_000
     )
 
+    # One shared return matrix for every probe: the bisection then compares
+    # portfolio levels against identical market paths, which makes the
+    # success rate monotone in the portfolio and the search sound
+    years = base_params['end_age'] - base_params['start_age']
+    shared_returns = _draw_return_matrix(
+        num_simulations, years,
+        base_params['expected_return'], base_params['volatility']
+    )
+    # Cached rates from earlier calls were computed against different draws;
+    # mixing them into this bisection would break its monotonicity
+    _success_rate_cache.clear()
+
+    hustle = base_params.get('emergency_hustle') or {}
+    rules = base_params.get('spending_rules') or {}
+    if not hustle.get('enabled', False) and not rules.get('enabled', False):
+        # Without the behavioral rules every path is linear in the starting
+        # portfolio, so one pass over the shared draws solves all paths at
+        # once: take the target quantile of the per-path break-evens instead
+        # of running a Monte Carlo per bisection probe
+        break_evens = _break_even_portfolios(shared_returns, base_params)
+        k = max(int(np.ceil(target_certainty * num_simulations)), 1)
+        k = min(k, num_simulations)
+        required = int(np.partition(break_evens, k - 1)[k - 1]) + 1
+        _required_portfolio_cache[key] = required
+        _last_required_portfolio = required
+        return required
+
+    if _last_required_portfolio is not None:
+        # Try a tight bracket around the previous answer first; one probe
+        # tells us whether the root is inside it or above it
+        warm_high = _last_required_portfolio * 2
+        if _success_rate_at(base_params, warm_high, num_simulations,
+                            shared_returns) >= target_certainty:
+            low = min(low, _last_required_portfolio // 2)
+            high = warm_high
+        else:
+            low = warm_high
+
     # Binary search with €10k precision
     while high - low > 10_000:
         mid = (low + high) // 2
-        test_params = copy.deepcopy(base_params)
-        test_params['starting_portfolio'] = mid
 
-        result = run_monte_carlo(test_params, num_simulations)
-        success_rate = result['summary']['success_rate']
-
-        if success_rate >= target_certainty:
+        if _success_rate_at(base_params, mid, num_simulations,
+                            shared_returns) >= target_certainty:
             high = mid
         else:
             low = mid
 
+    _required_portfolio_cache[key] = high
+    _last_required_portfolio = high
     return high
 
 
@@ -581,8 +1197,6 @@ def calculate_legacy_tradeoff(
     Returns:
         Dict with trade-off curve data points
     """
-    import copy
-
     annual_expenses = base_params.get('annual_expenses', 30000)
     years = base_params['end_age'] - base_params['start_age']
 
@@ -593,12 +1207,20 @@ def calculate_legacy_tradeoff(
             for mult in [10, 12, 15, 18, 20, 22, 25, 28, 30, 35, 40]
         ]
 
+    # One shared return matrix for every portfolio level: the batch kernel
+    # already fans the paths out across cores, so reusing the draws removes
+    # the per-level RNG cost and keeps the curve free of sampling jitter
+    # between adjacent levels
+    shared_returns = _draw_return_matrix(
+        num_simulations, years,
+        base_params['expected_return'], base_params['volatility']
+    )
+
     results = []
     for portfolio in portfolio_levels:
-        test_params = copy.deepcopy(base_params)
-        test_params['starting_portfolio'] = portfolio
+        test_params = {**base_params, 'starting_portfolio': portfolio}
 
-        sim_result = run_monte_carlo(test_params, num_simulations)
+        sim_result = run_monte_carlo(test_params, num_simulations, all_returns=shared_returns)
         s = sim_result['summary']
 
         # Calculate "giving capacity" - portfolio above what's needed for safety
@@ -644,7 +1266,103 @@ def calculate_legacy_tradeoff(
     }
 
 
-def run_monte_carlo(params: dict, num_simulations: int = 1000) -> dict:
+def _draw_return_matrix(
+    num_simulations: int, years: int, mean: float, vol: float,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Draw a (num_simulations, years) float32 return matrix in one call.
+
+    Standard normals are drawn straight into float32 and mean/vol folded
+    in place, so the matrix is allocated exactly once at its final dtype;
+    float32 is ample precision for euro amounts and halves the memory
+    traffic of the simulation kernel.
+    """
+    if rng is None:
+        rng = _return_rng
+    returns = rng.standard_normal(
+        size=(num_simulations, years), dtype=np.float32
+    )
+    np.multiply(returns, np.float32(vol), out=returns)
+    np.add(returns, np.float32(mean), out=returns)
+    return returns
+
+
+def _build_summary(
+    batch: SimulationBatch,
+    death_ages: List[Optional[int]],
+    mortality_enabled: bool,
+    health_class: str,
+    tech_scenario: str,
+    survival_to_end_prob: float,
+    life_expectancy: Optional[float]
+) -> Dict[str, Any]:
+    """
+    Build the shared summary dict from an SoA batch.
+
+    Single source of truth for the summary block the drivers used to
+    copy-paste: vectorized reductions over the batch columns, np.partition
+    for the three final-value order statistics, and the mortality outcome
+    classification.
+    """
+    num_simulations = batch.num_paths
+    survived = batch.survived
+    survived_count = int(survived.sum())
+    success_rate = survived_count / num_simulations
+    failure_count = num_simulations - survived_count
+
+    # Three order statistics only - np.partition (introselect, O(N)) instead
+    # of a full sort
+    k_5 = int(num_simulations * 0.05)
+    k_median = num_simulations // 2
+    k_95 = int(num_simulations * 0.95)
+    final_values = np.partition(
+        batch.final_portfolio.astype(np.float64), [k_5, k_median, k_95]
+    )
+
+    ruin_ages_failed = batch.ruin_age[~survived]
+    avg_ruin_age = float(ruin_ages_failed.mean()) if failure_count else None
+
+    hustle_activations = int(batch.hustle_activated.sum())
+    spending_reductions = int(batch.spending_reduced.sum())
+    lean_mode_activations = int(batch.spending_went_lean.sum())
+
+    mortality_outcomes = _classify_mortality_outcomes(
+        survived.tolist(),
+        [int(a) if a >= 0 else None for a in batch.ruin_age],
+        death_ages, mortality_enabled
+    )
+
+    return {
+        "success_rate": success_rate,
+        "survived_count": survived_count,
+        "failure_count": failure_count,
+        "median_final": float(final_values[k_median]),
+        "avg_ruin_age": avg_ruin_age,
+        "hustle_activation_rate": hustle_activations / num_simulations,
+        "spending_reduction_rate": spending_reductions / num_simulations,
+        "lean_mode_rate": lean_mode_activations / num_simulations,
+        "percentile_5_final": float(final_values[k_5]),
+        "percentile_95_final": float(final_values[k_95]),
+        "mortality_enabled": mortality_enabled,
+        "health_class": health_class if mortality_enabled else None,
+        "tech_scenario": tech_scenario if mortality_enabled else None,
+        "survived_to_end": mortality_outcomes['survived_to_end'],
+        "died_with_money": mortality_outcomes['died_with_money'],
+        "ran_out_of_money": mortality_outcomes['ran_out_of_money'],
+        "real_failure_rate": mortality_outcomes['real_failure_rate'],
+        "avg_death_age": mortality_outcomes['avg_death_age'],
+        "death_before_end_rate": mortality_outcomes['death_before_end_rate'],
+        "theoretical_survival_to_end": survival_to_end_prob if mortality_enabled else 1.0,
+        "life_expectancy": life_expectancy if mortality_enabled else None
+    }
+
+
+def run_monte_carlo(
+    params: dict,
+    num_simulations: int = 1000,
+    all_returns: np.ndarray = None
+) -> dict:
     """
     Run Monte Carlo simulation and return results.
 
@@ -655,6 +1373,10 @@ def run_monte_carlo(params: dict, num_simulations: int = 1000) -> dict:
     - survived_to_end: Made it to end_age with money
     - died_with_money: Died naturally before running out
     - ran_out_of_money: Portfolio hit zero while still alive (true failure)
+
+    all_returns optionally supplies a pre-drawn (num_simulations, years)
+    return matrix; callers that probe several portfolio levels reuse one
+    draw so their results differ only by the parameter under test.
     """
     years = params['end_age'] - params['start_age']
     start_age = params['start_age']
@@ -669,58 +1391,42 @@ def run_monte_carlo(params: dict, num_simulations: int = 1000) -> dict:
         start_age, end_age, health_class, tech_scenario, mortality_enabled
     )
 
-    # Generate return sequences
-    all_returns = monte_carlo_returns(
-        years,
-        num_simulations,
-        mean=params['expected_return'],
-        std=params['volatility']
-    )
-
-    # Run simulations
-    results = []
-    death_ages = []
-
-    for returns in all_returns:
-        if mortality_enabled:
-            death_age = sample_death_age(
-                start_age, end_age, FINNISH_MALE_MORTALITY, health_class, tech_scenario
-            )
-        else:
-            death_age = None
-
-        death_ages.append(death_age)
-
-        result = run_simulation(
-            starting_portfolio=params['starting_portfolio'],
-            annual_expenses=params['annual_expenses'],
-            returns_sequence=returns,
-            start_age=params['start_age'],
-            inflation_rate=params['inflation'],
-            income_phases=params.get('income_phases'),
-            windfalls=params.get('windfalls'),
-            emergency_hustle=params.get('emergency_hustle'),
-            spending_rules=params.get('spending_rules')
+    # One generator for the whole run; an explicit seed makes the run
+    # reproducible (returns and death ages both come from this stream)
+    seed = params.get('seed')
+    rng = np.random.default_rng(seed) if seed is not None else _return_rng
+
+    # The full (num_simulations, years) surface is kept because the
+    # percentile trajectories need portfolio values at every year
+    if all_returns is None:
+        all_returns = _draw_return_matrix(
+            num_simulations, years,
+            params['expected_return'], params['volatility'], rng=rng
         )
-        results.append(result)
-
-    # Calculate summary stats
-    survived_count = sum(1 for r in results if r.survived)
-    success_rate = survived_count / num_simulations
-
-    final_values = sorted([r.final_portfolio for r in results])
-    median_final = final_values[len(final_values) // 2]
-
-    failures = [r for r in results if not r.survived]
-    ruin_ages = [r.ruin_age for r in failures]
-    avg_ruin_age = sum(ruin_ages) / len(ruin_ages) if ruin_ages else None
-
-    hustle_activations = sum(1 for r in results if r.hustle_activated)
-    spending_reductions = sum(1 for r in results if r.spending_reduced)
-    lean_mode_activations = sum(1 for r in results if r.spending_went_lean)
+    else:
+        num_simulations = all_returns.shape[0]
 
-    # Classify outcomes using helper
-    mortality_outcomes = _classify_mortality_outcomes(results, death_ages, mortality_enabled)
+    # Sample death ages (financial paths are independent of mortality)
+    if mortality_enabled:
+        death_ages = sample_death_ages_batch(
+            num_simulations, start_age, end_age,
+            FINNISH_MALE_MORTALITY, health_class, tech_scenario, rng=rng
+        )
+    else:
+        death_ages = [None] * num_simulations
+
+    # Run all paths through the vectorized kernel at once
+    batch = run_simulation_batch(
+        starting_portfolio=params['starting_portfolio'],
+        annual_expenses=params['annual_expenses'],
+        returns_matrix=all_returns,
+        start_age=params['start_age'],
+        inflation_rate=params['inflation'],
+        income_phases=params.get('income_phases'),
+        windfalls=params.get('windfalls'),
+        emergency_hustle=params.get('emergency_hustle'),
+        spending_rules=params.get('spending_rules')
+    )
 
     return {
         "params": {
@@ -738,38 +1444,21 @@ def run_monte_carlo(params: dict, num_simulations: int = 1000) -> dict:
             "spending_rules": params.get('spending_rules', {}),
             "mortality": mortality_config
         },
-        "percentiles": calculate_percentile_trajectories(results),
-        "failures": get_failure_examples(results, max_examples=30),
-        "close_calls": get_close_call_examples(results, threshold=300_000),
-        "summary": {
-            "success_rate": success_rate,
-            "failure_count": len(failures),
-            "median_final": median_final,
-            "avg_ruin_age": avg_ruin_age,
-            "hustle_activation_rate": hustle_activations / num_simulations,
-            "spending_reduction_rate": spending_reductions / num_simulations,
-            "lean_mode_rate": lean_mode_activations / num_simulations,
-            "percentile_5_final": final_values[int(len(final_values) * 0.05)],
-            "percentile_95_final": final_values[int(len(final_values) * 0.95)],
-            "mortality_enabled": mortality_enabled,
-            "health_class": health_class if mortality_enabled else None,
-            "tech_scenario": tech_scenario if mortality_enabled else None,
-            "survived_to_end": mortality_outcomes['survived_to_end'],
-            "died_with_money": mortality_outcomes['died_with_money'],
-            "ran_out_of_money": mortality_outcomes['ran_out_of_money'],
-            "real_failure_rate": mortality_outcomes['real_failure_rate'],
-            "avg_death_age": mortality_outcomes['avg_death_age'],
-            "death_before_end_rate": mortality_outcomes['death_before_end_rate'],
-            "theoretical_survival_to_end": survival_to_end_prob if mortality_enabled else 1.0,
-            "life_expectancy": life_expectancy if mortality_enabled else None
-        }
+        "percentiles": calculate_percentile_trajectories_batch(batch),
+        "failures": get_failure_examples_batch(batch, max_examples=30),
+        "close_calls": get_close_call_examples_batch(batch, threshold=300_000),
+        "summary": _build_summary(
+            batch, death_ages, mortality_enabled, health_class, tech_scenario,
+            survival_to_end_prob, life_expectancy
+        )
     }
 
 
 def run_simulation_with_custom_returns(
     params: dict,
     all_returns: List[List[float]],
-    scenario_id: str = None
+    scenario_id: str = None,
+    rng: Optional[np.random.Generator] = None
 ) -> dict:
     """
     Run simulation with externally-provided return sequences.
@@ -781,6 +1470,9 @@ def run_simulation_with_custom_returns(
         params: Simulation parameters
         all_returns: Pre-generated return sequences (one per simulation)
         scenario_id: Optional identifier for the scenario (for logging)
+        rng: Optional generator for the death-age draw; callers that seed
+            their return generation pass the same generator here so the
+            whole result is reproducible
 
     Returns:
         Same structure as run_monte_carlo() for UI compatibility
@@ -798,50 +1490,30 @@ def run_simulation_with_custom_returns(
         start_age, end_age, health_class, tech_scenario, mortality_enabled
     )
 
-    # Run simulations with custom returns
-    results = []
-    death_ages = []
-
-    for returns in all_returns:
-        if mortality_enabled:
-            death_age = sample_death_age(
-                start_age, end_age, FINNISH_MALE_MORTALITY, health_class, tech_scenario
-            )
-        else:
-            death_age = None
-
-        death_ages.append(death_age)
-
-        result = run_simulation(
-            starting_portfolio=params['starting_portfolio'],
-            annual_expenses=params['annual_expenses'],
-            returns_sequence=returns,
-            start_age=params['start_age'],
-            inflation_rate=params.get('inflation', 0),
-            income_phases=params.get('income_phases'),
-            windfalls=params.get('windfalls'),
-            emergency_hustle=params.get('emergency_hustle'),
-            spending_rules=params.get('spending_rules')
+    # Sample death ages in one vectorized draw (independent of the paths)
+    if mortality_enabled:
+        death_ages = sample_death_ages_batch(
+            num_simulations, start_age, end_age,
+            FINNISH_MALE_MORTALITY, health_class, tech_scenario,
+            rng=rng
         )
-        results.append(result)
-
-    # Calculate summary stats (same as run_monte_carlo)
-    survived_count = sum(1 for r in results if r.survived)
-    success_rate = survived_count / num_simulations
-
-    final_values = sorted([r.final_portfolio for r in results])
-    median_final = final_values[len(final_values) // 2]
-
-    failures = [r for r in results if not r.survived]
-    ruin_ages = [r.ruin_age for r in failures]
-    avg_ruin_age = sum(ruin_ages) / len(ruin_ages) if ruin_ages else None
-
-    hustle_activations = sum(1 for r in results if r.hustle_activated)
-    spending_reductions = sum(1 for r in results if r.spending_reduced)
-    lean_mode_activations = sum(1 for r in results if r.spending_went_lean)
-
-    # Classify outcomes using helper
-    mortality_outcomes = _classify_mortality_outcomes(results, death_ages, mortality_enabled)
+    else:
+        death_ages = [None] * num_simulations
+
+    # Run all sequences through the vectorized kernel as one SoA batch
+    batch = run_simulation_batch(
+        starting_portfolio=params['starting_portfolio'],
+        annual_expenses=params['annual_expenses'],
+        # Keep the caller's dtype: the stress path hands in float32 and the
+        # batch runner normalizes anything non-float to float64 itself
+        returns_matrix=np.asarray(all_returns),
+        start_age=params['start_age'],
+        inflation_rate=params.get('inflation', 0),
+        income_phases=params.get('income_phases'),
+        windfalls=params.get('windfalls'),
+        emergency_hustle=params.get('emergency_hustle'),
+        spending_rules=params.get('spending_rules')
+    )
 
     return {
         "params": {
@@ -858,31 +1530,13 @@ def run_simulation_with_custom_returns(
             "mortality": mortality_config,
             "scenario_id": scenario_id
         },
-        "percentiles": calculate_percentile_trajectories(results),
-        "failures": get_failure_examples(results, max_examples=30),
-        "close_calls": get_close_call_examples(results, threshold=300_000),
-        "summary": {
-            "success_rate": success_rate,
-            "failure_count": len(failures),
-            "median_final": median_final,
-            "avg_ruin_age": avg_ruin_age,
-            "hustle_activation_rate": hustle_activations / num_simulations,
-            "spending_reduction_rate": spending_reductions / num_simulations,
-            "lean_mode_rate": lean_mode_activations / num_simulations,
-            "percentile_5_final": final_values[int(len(final_values) * 0.05)],
-            "percentile_95_final": final_values[int(len(final_values) * 0.95)],
-            "mortality_enabled": mortality_enabled,
-            "health_class": health_class if mortality_enabled else None,
-            "tech_scenario": tech_scenario if mortality_enabled else None,
-            "survived_to_end": mortality_outcomes['survived_to_end'],
-            "died_with_money": mortality_outcomes['died_with_money'],
-            "ran_out_of_money": mortality_outcomes['ran_out_of_money'],
-            "real_failure_rate": mortality_outcomes['real_failure_rate'],
-            "avg_death_age": mortality_outcomes['avg_death_age'],
-            "death_before_end_rate": mortality_outcomes['death_before_end_rate'],
-            "theoretical_survival_to_end": survival_to_end_prob if mortality_enabled else 1.0,
-            "life_expectancy": life_expectancy if mortality_enabled else None
-        }
+        "percentiles": calculate_percentile_trajectories_batch(batch),
+        "failures": get_failure_examples_batch(batch, max_examples=30),
+        "close_calls": get_close_call_examples_batch(batch, threshold=300_000),
+        "summary": _build_summary(
+            batch, death_ages, mortality_enabled, health_class, tech_scenario,
+            survival_to_end_prob, life_expectancy
+        )
     }
 
 
@@ -917,51 +1571,62 @@ def run_historical_sequence(params: dict) -> dict:
     # Get all historical sequences (one per starting year)
     all_returns = historical_sequence_returns(years)
 
+    # Sample all death ages up front (one per historical period)
+    if mortality_enabled:
+        death_ages = sample_death_ages_batch(
+            len(all_returns), start_age, end_age, FINNISH_MALE_MORTALITY,
+            health_class, tech_scenario
+        )
+    else:
+        death_ages = [None] * len(all_returns)
+
+    # Hoist the parameter lookups out of the loop - dict hashing per period
+    # adds up over 150 sequences
+    starting_portfolio = params['starting_portfolio']
+    annual_expenses = params['annual_expenses']
+    income_phases = params.get('income_phases')
+    windfalls = params.get('windfalls')
+    emergency_hustle = params.get('emergency_hustle')
+    spending_rules = params.get('spending_rules')
+
     # Run simulation for each historical period
     results = []
-    death_ages = []
     for returns in all_returns:
-        # Sample death age for this historical period (if mortality enabled)
-        if mortality_enabled:
-            death_age = sample_death_age(start_age, end_age, FINNISH_MALE_MORTALITY, health_class, tech_scenario)
-        else:
-            death_age = None
-        death_ages.append(death_age)
-
         result = run_simulation(
-            starting_portfolio=params['starting_portfolio'],
-            annual_expenses=params['annual_expenses'],
+            starting_portfolio=starting_portfolio,
+            annual_expenses=annual_expenses,
             returns_sequence=returns,
             start_age=start_age,
             inflation_rate=0,  # Returns are already real (inflation-adjusted)
-            income_phases=params.get('income_phases'),
-            windfalls=params.get('windfalls'),
-            emergency_hustle=params.get('emergency_hustle'),
-            spending_rules=params.get('spending_rules')
+            income_phases=income_phases,
+            windfalls=windfalls,
+            emergency_hustle=emergency_hustle,
+            spending_rules=spending_rules
         )
         results.append(result)
 
-    # Calculate summary statistics
-    survived_count = sum(1 for r in results if r.survived)
-    success_rate = survived_count / len(results)
-
-    final_values = sorted([r.final_portfolio for r in results])
-    median_final = final_values[len(final_values) // 2]
-
-    failures = [r for r in results if not r.survived]
-    ruin_ages = [r.ruin_age for r in failures]
-    avg_ruin_age = sum(ruin_ages) / len(ruin_ages) if ruin_ages else None
-
-    # Classify outcomes using helper
-    mortality_outcomes = _classify_mortality_outcomes(results, death_ages, mortality_enabled)
-
-    # Map failures back to starting years
+    # Calculate summary statistics in a single pass over the results
+    survived_count = 0
+    hustle_activations = 0
+    spending_reductions = 0
+    final_values = []
+    survived_flags = []
+    ruin_ages_all = []
+    ruin_age_sum = 0
     failure_details = []
+
     for i, r in enumerate(results):
+        final_values.append(r.final_portfolio)
+        survived_flags.append(r.survived)
+        ruin_ages_all.append(r.ruin_age)
+        survived_count += r.survived
+        hustle_activations += r.hustle_activated
+        spending_reductions += r.spending_reduced
         if not r.survived:
-            start_year = historical_years[i]
+            ruin_age_sum += r.ruin_age
+            # Map failure back to its starting year
             failure_details.append({
-                'start_year': start_year,
+                'start_year': historical_years[i],
                 'ruin_age': r.ruin_age,
                 'trajectory': r.portfolio_values,
                 'ages': r.ages,
@@ -969,12 +1634,28 @@ def run_historical_sequence(params: dict) -> dict:
                 'spending_reduced': r.spending_reduced
             })
 
-    # Sort failures by start year
-    failure_details = sorted(failure_details, key=lambda x: x['start_year'])
+    success_rate = survived_count / len(results)
+    failure_count = len(failure_details)
+    avg_ruin_age = ruin_age_sum / failure_count if failure_count else None
+
+    # Three order statistics only - np.partition (introselect, O(N)) instead
+    # of a full sort
+    num_periods = len(results)
+    k_5 = int(num_periods * 0.05)
+    k_median = num_periods // 2
+    k_95 = int(num_periods * 0.95)
+    final_values = np.partition(
+        np.asarray(final_values, dtype=np.float64), [k_5, k_median, k_95]
+    )
+    median_final = float(final_values[k_median])
 
-    # Track activation rates
-    hustle_activations = sum(1 for r in results if r.hustle_activated)
-    spending_reductions = sum(1 for r in results if r.spending_reduced)
+    # Classify outcomes using helper
+    mortality_outcomes = _classify_mortality_outcomes(
+        survived_flags, ruin_ages_all, death_ages, mortality_enabled
+    )
+
+    # Sort failures by start year
+    failure_details.sort(key=lambda x: x['start_year'])
 
     return {
         'method': 'historical_sequence',
@@ -995,11 +1676,11 @@ def run_historical_sequence(params: dict) -> dict:
         'summary': {
             'success_rate': success_rate,
             'survived_count': survived_count,
-            'failure_count': len(failures),
+            'failure_count': failure_count,
             'median_final': median_final,
             'avg_ruin_age': avg_ruin_age,
-            'percentile_5_final': final_values[int(len(final_values) * 0.05)],
-            'percentile_95_final': final_values[int(len(final_values) * 0.95)],
+            'percentile_5_final': float(final_values[k_5]),
+            'percentile_95_final': float(final_values[k_95]),
             'hustle_activation_rate': hustle_activations / len(results),
             'spending_reduction_rate': spending_reductions / len(results),
             # Mortality stats
@@ -1042,9 +1723,14 @@ def run_and_export(
 
     result = run_monte_carlo(params, num_simulations)
 
+    # orjson writes bytes via a C encoder and serializes NumPy values
+    # natively; compact output (no indent) keeps the file a fraction of
+    # the pretty-printed size
     output_file = Path(__file__).parent / output_path
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            result, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ))
 
     s = result['summary']
     print(f"\nExported to {output_file}")
@@ -8,12 +8,72 @@ income, windfall events, emergency hustle, and dynamic spending rules.
 from dataclasses import dataclass
 from typing import List, Optional
 
-
-@dataclass
+import numpy as np
+
+try:
+    from sim_kernel import evolve_paths as _evolve_paths_jit
+    from sim_kernel import warmup as _warmup_jit
+except ImportError:  # numba not installed - fall back to the NumPy batch loop
+    _evolve_paths_jit = None
+    _warmup_jit = None
+
+
+def warm_up_kernel() -> None:
+    """Compile the jitted batch kernel ahead of the first real request."""
+    if _warmup_jit is not None:
+        _warmup_jit()
+
+
+@dataclass(frozen=True, slots=True)
+class EmergencyHustle:
+    """Emergency-hustle config flattened to attributes for the year loop."""
+    enabled: bool
+    trigger_age_max: int
+    portfolio_threshold: float
+    extra_income: float
+    duration: int
+
+    @classmethod
+    def from_dict(cls, config: Optional[dict], start_age: int) -> "EmergencyHustle":
+        config = config or {}
+        return cls(
+            enabled=bool(config.get('enabled', False)),
+            trigger_age_max=config.get('trigger_age_max', start_age + 5),
+            portfolio_threshold=config.get('portfolio_threshold', 0.70),
+            extra_income=config.get('extra_income', 0),
+            duration=config.get('duration', 3),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SpendingRules:
+    """Dynamic spending-rule config flattened to attributes for the year loop."""
+    enabled: bool
+    drop_threshold: float
+    recovery_threshold: float
+    lean_age: int
+    reduced_spending: float
+    lean_spending: float
+
+    @classmethod
+    def from_dict(cls, config: Optional[dict]) -> "SpendingRules":
+        config = config or {}
+        enabled = bool(config.get('enabled', False))
+        return cls(
+            enabled=enabled,
+            drop_threshold=config['drop_threshold'] if enabled else 0.0,
+            recovery_threshold=config['recovery_threshold'] if enabled else 0.0,
+            lean_age=config.get('lean_age', 60),
+            reduced_spending=config['reduced_spending'] if enabled else 0.0,
+            lean_spending=config['lean_spending'] if enabled else 0.0,
+        )
+
+
+@dataclass(slots=True)
 class SimulationResult:
     """Results of a single simulation run."""
-    portfolio_values: List[float]
-    ages: List[int]
+    portfolio_values: np.ndarray
+    ages: np.ndarray
     ruin_age: Optional[int]
     final_portfolio: float
     hustle_activated: bool = False
@@ -21,6 +81,8 @@ class SimulationResult:
     spending_reduced: bool = False
     spending_went_lean: bool = False
     spending_changes: Optional[List[dict]] = None
+    min_value: float = 0.0   # lowest portfolio value along the trajectory
+    min_age: int = 0         # age at which that minimum occurred
 
     @property
     def survived(self) -> bool:
@@ -37,6 +99,44 @@ def get_windfall_for_age(age: int, windfalls: List[dict]) -> float:
     return sum(w['amount'] for w in windfalls if w['age'] == age)
 
 
+def build_income_schedule(ages: np.ndarray, income_phases: Optional[List[dict]]) -> np.ndarray:
+    """
+    Flatten income phases into a per-year vector aligned with `ages`.
+
+    Entry k holds the income at age ages[k] (consecutive integer ages).
+    Matches get_income_for_age: the first phase covering an age wins, so
+    phases are written in reverse order and earlier ones overwrite.
+    """
+    schedule = np.zeros(len(ages), dtype=np.float64)
+    if not income_phases:
+        return schedule
+    base = int(ages[0])
+    for phase in reversed(income_phases):
+        lo = max(int(phase['start_age']) - base, 0)
+        hi = min(int(phase['end_age']) - base + 1, len(ages))
+        if lo < hi:
+            schedule[lo:hi] = phase['amount']
+    return schedule
+
+
+def build_windfall_schedule(ages: np.ndarray, windfalls: Optional[List[dict]]) -> np.ndarray:
+    """
+    Flatten windfalls into a per-year vector aligned with `ages`.
+
+    Windfalls landing at the same age accumulate, mirroring
+    get_windfall_for_age.
+    """
+    schedule = np.zeros(len(ages), dtype=np.float64)
+    if not windfalls:
+        return schedule
+    base = int(ages[0])
+    for windfall in windfalls:
+        idx = int(windfall['age']) - base
+        if 0 <= idx < len(ages):
+            schedule[idx] += windfall['amount']
+    return schedule
+
+
 def simulate_single_year(
     portfolio: float,
     return_rate: float,
@@ -51,6 +151,22 @@ def simulate_single_year(
     return portfolio_after_growth - net_withdrawal
 
 
+def format_currency(amount: float) -> str:
+    """Format a euro amount with thousands separators (no cents)."""
+    return f"€{amount:,.0f}"
+
+
+def calculate_withdrawal_rate(
+    portfolio: float,
+    annual_expenses: float,
+    annual_income: float = 0.0
+) -> float:
+    """Net spending need (expenses minus income) as a share of the portfolio."""
+    if portfolio <= 0:
+        return float('inf')
+    return max(0.0, annual_expenses - annual_income) / portfolio
+
+
 def run_simulation(
     starting_portfolio: float,
     annual_expenses: float,
@@ -68,10 +184,32 @@ def run_simulation(
     income_phases = income_phases or []
     windfalls = windfalls or []
 
-    portfolio_values = [portfolio]
-    ages = [start_age]
+    # Flatten the optional config dicts once; the year loop reads frozen
+    # dataclass attributes instead of repeating dict lookups per year
+    hustle = EmergencyHustle.from_dict(emergency_hustle, start_age)
+    rules = SpendingRules.from_dict(spending_rules)
+    hustle_portfolio_floor = starting_portfolio * hustle.portfolio_threshold
+    drop_threshold = starting_portfolio * rules.drop_threshold
+    recovery_threshold = starting_portfolio * rules.recovery_threshold
+
+    # Preallocate the trajectory once; ages are just consecutive integers
+    years = len(returns_sequence)
+    portfolio_values = np.empty(years + 1, dtype=np.float64)
+    portfolio_values[0] = portfolio
+    ages = np.arange(start_age, start_age + years + 1, dtype=np.int64)
     ruin_age = None
 
+    # Flatten income phases and windfalls into per-year vectors indexed by
+    # year_index (ages[1:] is the age at the END of each year), replacing
+    # a phase scan per year with a direct read
+    income_schedule = build_income_schedule(ages[1:], income_phases)
+    windfall_schedule = build_windfall_schedule(ages[1:], windfalls)
+
+    # Running trajectory minimum, tracked in the loop that already touches
+    # the portfolio (saves the post-hoc min scan in close-call analysis)
+    min_value = portfolio
+    min_age = start_age
+
     # Income grows with inflation
     inflation_multiplier = 1.0
 
@@ -91,25 +229,24 @@ def run_simulation(
         # Age at END of this year (year 0 ends at age 48 if start_age=47)
         current_age = start_age + year_index + 1
 
-        windfall = get_windfall_for_age(current_age, windfalls)
+        windfall = windfall_schedule[year_index]
         if windfall > 0:
             portfolio += windfall
 
-        base_income = get_income_for_age(current_age, income_phases)
-        income = base_income * inflation_multiplier
+        income = income_schedule[year_index] * inflation_multiplier
 
         # Emergency hustle: return to work if portfolio crashes early
         extra_hustle_income = 0.0
-        if emergency_hustle and emergency_hustle.get('enabled', False):
+        if hustle.enabled:
             if (not hustle_triggered and
-                current_age <= emergency_hustle.get('trigger_age_max', start_age + 5) and
-                portfolio < starting_portfolio * emergency_hustle.get('portfolio_threshold', 0.70)):
+                current_age <= hustle.trigger_age_max and
+                portfolio < hustle_portfolio_floor):
                 hustle_triggered = True
                 hustle_activation_age = current_age
-                hustle_years_remaining = emergency_hustle.get('duration', 3)
+                hustle_years_remaining = hustle.duration
 
             if hustle_years_remaining > 0:
-                extra_hustle_income = emergency_hustle.get('extra_income', 0) * inflation_multiplier
+                extra_hustle_income = hustle.extra_income * inflation_multiplier
                 hustle_years_remaining -= 1
 
         # Dynamic spending rules (only when hustle is NOT active)
@@ -117,13 +254,9 @@ def run_simulation(
         # - Drop below drop_threshold -> enter reduced/lean
         # - Rise above recovery_threshold -> return to normal
         # - Between thresholds -> stay in current state
-        if spending_rules and spending_rules.get('enabled', False) and hustle_years_remaining == 0:
-            rules = spending_rules
-            drop_threshold = starting_portfolio * rules['drop_threshold']
-            recovery_threshold = starting_portfolio * rules['recovery_threshold']
-
+        if rules.enabled and hustle_years_remaining == 0:
             if portfolio < drop_threshold:
-                new_state = 'lean' if current_age >= rules.get('lean_age', 60) else 'reduced'
+                new_state = 'lean' if current_age >= rules.lean_age else 'reduced'
             elif portfolio >= recovery_threshold:
                 new_state = 'normal'
             else:
@@ -146,23 +279,23 @@ def run_simulation(
 
             # Apply spending level (all amounts grow with inflation)
             if spending_state == 'lean':
-                expenses = rules['lean_spending'] * inflation_multiplier
+                expenses = rules.lean_spending * inflation_multiplier
             elif spending_state == 'reduced':
-                expenses = rules['reduced_spending'] * inflation_multiplier
+                expenses = rules.reduced_spending * inflation_multiplier
             else:
                 expenses = annual_expenses_base * inflation_multiplier
 
         portfolio = simulate_single_year(portfolio, return_rate, expenses, income + extra_hustle_income)
 
-        portfolio_values.append(portfolio)
-        ages.append(current_age)
+        portfolio_values[year_index + 1] = portfolio
+        if portfolio < min_value:
+            min_value = portfolio
+            min_age = current_age
 
         if portfolio <= 0:
             ruin_age = current_age
-            # Fill remaining years with zero for consistent array length
-            remaining_years = len(returns_sequence) - year_index - 1
-            portfolio_values.extend([0] * remaining_years)
-            ages.extend(range(current_age + 1, current_age + remaining_years + 1))
+            # Zero-fill the remaining years for consistent array length
+            portfolio_values[year_index + 2:] = 0.0
             break
 
         # Compound inflation for next year:
@@ -175,12 +308,257 @@ def run_simulation(
         portfolio_values=portfolio_values,
         ages=ages,
         ruin_age=ruin_age,
-        final_portfolio=portfolio_values[-1],
+        final_portfolio=float(portfolio_values[-1]),
+        hustle_activated=hustle_triggered,
+        hustle_activation_age=hustle_activation_age,
+        spending_reduced=spending_reduced,
+        spending_went_lean=spending_went_lean,
+        spending_changes=spending_changes if spending_changes else None,
+        min_value=min_value,
+        min_age=min_age
+    )
+
+
+# =============================================================================
+# VECTORIZED BATCH SIMULATION (structure-of-arrays)
+# =============================================================================
+
+@dataclass
+class SimulationBatch:
+    """
+    Results of many simulation runs in structure-of-arrays layout.
+
+    One row per simulated path. Ages are shared by all paths. Sentinel -1 in
+    ruin_age / hustle_activation_age means "never happened" for that path.
+    """
+    portfolios: np.ndarray            # (num_paths, years + 1) portfolio values
+    ages: np.ndarray                  # (years + 1,) age at each column
+    ruin_age: np.ndarray              # (num_paths,) int, -1 if never ruined
+    hustle_activated: np.ndarray      # (num_paths,) bool
+    hustle_activation_age: np.ndarray # (num_paths,) int, -1 if never activated
+    spending_reduced: np.ndarray      # (num_paths,) bool
+    spending_went_lean: np.ndarray    # (num_paths,) bool
+    path_min: np.ndarray              # (num_paths,) row minimum, tracked in-loop
+    path_min_idx: np.ndarray          # (num_paths,) column index of that minimum
+
+    @property
+    def num_paths(self) -> int:
+        return self.portfolios.shape[0]
+
+    @property
+    def final_portfolio(self) -> np.ndarray:
+        return self.portfolios[:, -1]
+
+    @property
+    def survived(self) -> np.ndarray:
+        return self.ruin_age < 0
+
+
+def run_simulation_batch(
+    starting_portfolio: float,
+    annual_expenses: float,
+    returns_matrix: np.ndarray,
+    start_age: int,
+    inflation_rate: float = 0.0,
+    income_phases: Optional[List[dict]] = None,
+    windfalls: Optional[List[dict]] = None,
+    emergency_hustle: Optional[dict] = None,
+    spending_rules: Optional[dict] = None
+) -> SimulationBatch:
+    """
+    Run many retirement simulations at once, vectorized across paths.
+
+    Equivalent to calling run_simulation() once per row of returns_matrix,
+    but the year loop operates on whole (num_paths,) arrays instead of
+    scalars, so the cost per path-year is a handful of NumPy ops rather
+    than Python bytecode. Ruined paths are clamped to zero and frozen.
+
+    The storage dtype follows the returns matrix: feeding float32 returns
+    keeps the whole (paths x years) working set at half the memory
+    bandwidth, which is plenty of precision for euro amounts. Summary
+    consumers should upcast aggregates to float64.
+    """
+    returns_matrix = np.asarray(returns_matrix)
+    if returns_matrix.dtype not in (np.float32, np.float64):
+        returns_matrix = returns_matrix.astype(np.float64)
+    dtype = returns_matrix.dtype
+    num_paths, years = returns_matrix.shape
+    income_phases = income_phases or []
+    windfalls = windfalls or []
+
+    # Age at the END of each simulated year (year 0 ends at start_age + 1)
+    ages_after = start_age + 1 + np.arange(years)
+
+    # (1+inflation)^t for t in [0, years) built once via cumprod - the per
+    # path-year compounding this replaces was O(paths * years) multiplies
+    inflation_multipliers = np.empty(years, dtype=np.float64)
+    if years > 0:
+        inflation_multipliers[0] = 1.0
+        np.cumprod(np.full(years - 1, 1.0 + inflation_rate), out=inflation_multipliers[1:])
+
+    # Per-year schedules shared by every path, filled by slicing per phase
+    # instead of scanning the dicts once per age
+    income_schedule = (
+        build_income_schedule(ages_after, income_phases) * inflation_multipliers
+    ).astype(dtype)
+    windfall_schedule = build_windfall_schedule(ages_after, windfalls).astype(dtype)
+
+    # Flatten the optional config dicts to plain scalars (zeros when the
+    # feature is disabled) so both the NumPy loop and the jitted kernel can
+    # consume them uniformly
+    hustle = EmergencyHustle.from_dict(emergency_hustle, start_age)
+    rules = SpendingRules.from_dict(spending_rules)
+
+    hustle_enabled = hustle.enabled
+    if hustle_enabled:
+        hustle_trigger_age_max = hustle.trigger_age_max
+        hustle_threshold = starting_portfolio * hustle.portfolio_threshold
+        hustle_extra_income = hustle.extra_income
+        hustle_duration = hustle.duration
+    else:
+        hustle_trigger_age_max = 0
+        hustle_threshold = 0.0
+        hustle_extra_income = 0.0
+        hustle_duration = 0
+
+    rules_enabled = rules.enabled
+    if rules_enabled:
+        drop_threshold = starting_portfolio * rules.drop_threshold
+        recovery_threshold = starting_portfolio * rules.recovery_threshold
+        lean_age = rules.lean_age
+        reduced_spending = rules.reduced_spending
+        lean_spending = rules.lean_spending
+    else:
+        drop_threshold = 0.0
+        recovery_threshold = 0.0
+        lean_age = 0
+        reduced_spending = 0.0
+        lean_spending = 0.0
+
+    ages = np.arange(start_age, start_age + years + 1)
+
+    if _evolve_paths_jit is not None:
+        (portfolios, ruin_age, hustle_triggered, hustle_activation_age,
+         spending_reduced, spending_went_lean,
+         path_min, path_min_idx) = _evolve_paths_jit(
+            returns_matrix,
+            float(starting_portfolio), float(annual_expenses),
+            start_age,
+            income_schedule, windfall_schedule, inflation_multipliers,
+            hustle_enabled, hustle_trigger_age_max, float(hustle_threshold),
+            float(hustle_extra_income), hustle_duration,
+            rules_enabled, float(drop_threshold), float(recovery_threshold),
+            lean_age, float(reduced_spending), float(lean_spending)
+        )
+        return SimulationBatch(
+            portfolios=portfolios,
+            ages=ages,
+            ruin_age=ruin_age,
+            hustle_activated=hustle_triggered,
+            hustle_activation_age=hustle_activation_age,
+            spending_reduced=spending_reduced,
+            spending_went_lean=spending_went_lean,
+            path_min=path_min,
+            path_min_idx=path_min_idx
+        )
+
+    portfolios = np.empty((num_paths, years + 1), dtype=dtype)
+    portfolios[:, 0] = starting_portfolio
+
+    # Running row minimum, maintained alongside the evolution so close-call
+    # analysis never rescans the trajectory matrix
+    path_min = np.full(num_paths, starting_portfolio, dtype=dtype)
+    path_min_idx = np.zeros(num_paths, dtype=np.int64)
+
+    alive = np.ones(num_paths, dtype=bool)
+    ruin_age = np.full(num_paths, -1, dtype=np.int64)
+
+    # Emergency hustle state (per path)
+    hustle_triggered = np.zeros(num_paths, dtype=bool)
+    hustle_activation_age = np.full(num_paths, -1, dtype=np.int64)
+    hustle_years_remaining = np.zeros(num_paths, dtype=np.int64)
+
+    # Spending rules state (per path): 0 = normal, 1 = reduced, 2 = lean
+    spending_state = np.zeros(num_paths, dtype=np.int8)
+    spending_reduced = np.zeros(num_paths, dtype=bool)
+    spending_went_lean = np.zeros(num_paths, dtype=bool)
+
+    # Per-path spending level in today's euros (spending rules can move
+    # individual paths off the base level); actual expenses in year t are
+    # expense_level * inflation_multipliers[t]
+    expense_level = np.full(num_paths, annual_expenses, dtype=dtype)
+
+    for t in range(years):
+        current_age = start_age + t + 1
+        infl = inflation_multipliers[t]
+
+        p = portfolios[:, t] + windfall_schedule[t]
+        income = np.full(num_paths, income_schedule[t], dtype=dtype)
+
+        if hustle_enabled:
+            trigger = (
+                alive & ~hustle_triggered
+                & (current_age <= hustle_trigger_age_max)
+                & (p < hustle_threshold)
+            )
+            hustle_triggered |= trigger
+            hustle_activation_age[trigger] = current_age
+            hustle_years_remaining[trigger] = hustle_duration
+
+            hustle_active = hustle_years_remaining > 0
+            income[hustle_active] += hustle_extra_income * infl
+            hustle_years_remaining[hustle_active] -= 1
+
+        if rules_enabled:
+            # Paths still working the hustle skip the spending rules,
+            # mirroring the scalar state machine
+            eligible = alive & (hustle_years_remaining == 0)
+
+            target_state = np.where(
+                p < drop_threshold,
+                2 if current_age >= lean_age else 1,
+                np.where(p >= recovery_threshold, 0, spending_state)
+            ).astype(np.int8)
+            spending_state = np.where(eligible, target_state, spending_state)
+
+            in_reduced = eligible & (spending_state == 1)
+            in_lean = eligible & (spending_state == 2)
+            spending_reduced |= in_reduced | in_lean
+            spending_went_lean |= in_lean
+
+            expense_level[in_reduced] = reduced_spending
+            expense_level[in_lean] = lean_spending
+            normal = eligible & (spending_state == 0)
+            expense_level[normal] = annual_expenses
+
+        net_withdrawal = np.maximum(0.0, expense_level * infl - income)
+        p = p * (1.0 + returns_matrix[:, t]) - net_withdrawal
+
+        newly_ruined = alive & (p <= 0)
+        ruin_age[newly_ruined] = current_age
+        alive &= ~newly_ruined
+
+        portfolios[:, t + 1] = np.where(alive, np.maximum(p, 0.0), 0.0)
+
+        better = portfolios[:, t + 1] < path_min
+        path_min[better] = portfolios[better, t + 1]
+        path_min_idx[better] = t + 1
+
+        if not alive.any():
+            # Every path is ruined - the remaining columns are all zero
+            portfolios[:, t + 2:] = 0.0
+            break
+
+    return SimulationBatch(
+        portfolios=portfolios,
+        ages=ages,
+        ruin_age=ruin_age,
         hustle_activated=hustle_triggered,
         hustle_activation_age=hustle_activation_age,
         spending_reduced=spending_reduced,
         spending_went_lean=spending_went_lean,
-        spending_changes=spending_changes if spending_changes else None
+        path_min=path_min,
+        path_min_idx=path_min_idx
     )
 
 
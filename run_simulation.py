@@ -15,11 +15,13 @@ Run with: python run_simulation.py
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 # Import our modules
 from config import DEFAULT_PARAMS
 from fire_simulator import (
-    run_simulation, SimulationResult, format_currency,
-    calculate_withdrawal_rate, get_income_for_age
+    run_simulation, run_simulation_batch, SimulationResult, SimulationBatch,
+    format_currency, calculate_withdrawal_rate, get_income_for_age
 )
 from scenarios import SCENARIOS, monte_carlo_returns
 
@@ -86,20 +88,18 @@ class MonteCarloSummary:
     ruin_ages: List[int]
 
 
-def percentile(data: List[float], p: float) -> float:
-    """Calculate percentile from sorted data."""
-    idx = int(len(data) * p / 100)
-    return data[min(idx, len(data) - 1)]
-
-
 def run_monte_carlo(params: dict, num_simulations: int = 1000,
-                    all_returns: List[List[float]] = None) -> Tuple[List[SimulationResult], MonteCarloSummary]:
+                    all_returns: np.ndarray = None) -> Tuple[SimulationBatch, MonteCarloSummary]:
     """Run Monte Carlo simulation with many random futures.
 
+    All paths go through the vectorized batch engine in one call instead
+    of num_simulations Python-level run_simulation() invocations.
+
     Args:
         params: Simulation parameters
         num_simulations: Number of simulations (ignored if all_returns provided)
-        all_returns: Optional pre-generated return sequences for A/B comparison
+        all_returns: Optional pre-generated (N, years) return matrix for
+            A/B comparison against identical market conditions
     """
     if all_returns is None:
         years = params['end_age'] - params['start_age']
@@ -109,36 +109,37 @@ def run_monte_carlo(params: dict, num_simulations: int = 1000,
             std=params['volatility']
         )
 
-    all_results = []
-    for returns in all_returns:
-        result = run_simulation(
-            starting_portfolio=params['starting_portfolio'],
-            annual_expenses=params['annual_expenses'],
-            returns_sequence=returns,
-            start_age=params['start_age'],
-            inflation_rate=params['inflation'],
-            income_phases=params.get('income_phases'),
-            windfalls=params.get('windfalls'),
-            emergency_hustle=params.get('emergency_hustle'),
-            spending_rules=params.get('spending_rules')
-        )
-        all_results.append(result)
+    batch = run_simulation_batch(
+        starting_portfolio=params['starting_portfolio'],
+        annual_expenses=params['annual_expenses'],
+        returns_matrix=np.asarray(all_returns, dtype=np.float64),
+        start_age=params['start_age'],
+        inflation_rate=params['inflation'],
+        income_phases=params.get('income_phases'),
+        windfalls=params.get('windfalls'),
+        emergency_hustle=params.get('emergency_hustle'),
+        spending_rules=params.get('spending_rules')
+    )
 
-    final_values = sorted([r.final_portfolio for r in all_results])
-    survived_count = sum(1 for r in all_results if r.survived)
-    ruin_ages = [r.ruin_age for r in all_results if r.ruin_age is not None]
+    survived_count = int(batch.survived.sum())
+    ruin_ages = [int(a) for a in batch.ruin_age if a >= 0]
+
+    # Partition-based selection on the SoA column - no full sort needed
+    p5, p25, p50, p75, p95 = np.percentile(
+        batch.final_portfolio.astype(np.float64), [5, 25, 50, 75, 95]
+    )
 
     summary = MonteCarloSummary(
-        success_rate=survived_count / len(all_returns),
-        median_final=percentile(final_values, 50),
-        percentile_5=percentile(final_values, 5),
-        percentile_25=percentile(final_values, 25),
-        percentile_75=percentile(final_values, 75),
-        percentile_95=percentile(final_values, 95),
+        success_rate=survived_count / batch.num_paths,
+        median_final=float(p50),
+        percentile_5=float(p5),
+        percentile_25=float(p25),
+        percentile_75=float(p75),
+        percentile_95=float(p95),
         ruin_ages=ruin_ages
     )
 
-    return all_results, summary
+    return batch, summary
 
 
 def print_monte_carlo_summary(summary: MonteCarloSummary, num_simulations: int):
@@ -167,17 +168,35 @@ def print_monte_carlo_summary(summary: MonteCarloSummary, num_simulations: int):
 # =============================================================================
 
 def find_bulletproof_floor(params: dict, target_success_rate: float = 0.95,
-                           num_simulations: int = 500) -> float:
-    """Find minimum starting portfolio for target success rate."""
+                           num_simulations: int = 500,
+                           all_returns: np.ndarray = None) -> float:
+    """Find minimum starting portfolio for target success rate.
+
+    All bisection probes share one return matrix (common random numbers),
+    so the success rate is a deterministic, monotone function of the
+    starting portfolio and the search converges without Monte Carlo
+    noise flipping the comparison near the target.
+    """
     low = 100_000
     high = params['starting_portfolio'] * 2
 
+    if all_returns is None:
+        years = params['end_age'] - params['start_age']
+        all_returns = monte_carlo_returns(
+            years, num_simulations,
+            mean=params['expected_return'],
+            std=params['volatility']
+        )
+
+    # One shallow copy reused across all probes; only the starting
+    # portfolio changes between iterations
+    test_params = params.copy()
+
     while high - low > 10_000:
         mid = (low + high) / 2
-        test_params = params.copy()
         test_params['starting_portfolio'] = mid
 
-        _, summary = run_monte_carlo(test_params, num_simulations)
+        _, summary = run_monte_carlo(test_params, all_returns=all_returns)
 
         if summary.success_rate >= target_success_rate:
             high = mid
@@ -212,16 +231,18 @@ def print_bulletproof_analysis(params: dict, floor: float):
 # WINDFALL COMPARISON
 # =============================================================================
 
-def compare_with_windfalls(params: dict, num_simulations: int = 1000):
+def compare_with_windfalls(params: dict, num_simulations: int = 1000,
+                           all_returns: np.ndarray = None):
     """Compare outcomes with and without windfalls using identical market conditions."""
-    years = params['end_age'] - params['start_age']
+    if all_returns is None:
+        years = params['end_age'] - params['start_age']
 
-    # Generate return sequences ONCE
-    all_returns = monte_carlo_returns(
-        years, num_simulations,
-        mean=params['expected_return'],
-        std=params['volatility']
-    )
+        # Generate return sequences ONCE
+        all_returns = monte_carlo_returns(
+            years, num_simulations,
+            mean=params['expected_return'],
+            std=params['volatility']
+        )
 
     # Without windfalls
     no_windfall_params = params.copy()
@@ -253,33 +274,35 @@ def compare_with_windfalls(params: dict, num_simulations: int = 1000):
 # EMERGENCY HUSTLE COMPARISON
 # =============================================================================
 
-def compare_with_hustle(params: dict, num_simulations: int = 1000):
+def compare_with_hustle(params: dict, num_simulations: int = 1000,
+                        all_returns: np.ndarray = None):
     """Compare outcomes with and without emergency hustle using identical market conditions."""
-    years = params['end_age'] - params['start_age']
+    if all_returns is None:
+        years = params['end_age'] - params['start_age']
 
-    # Generate return sequences ONCE
-    all_returns = monte_carlo_returns(
-        years,
-        num_simulations,
-        mean=params['expected_return'],
-        std=params['volatility']
-    )
+        # Generate return sequences ONCE
+        all_returns = monte_carlo_returns(
+            years,
+            num_simulations,
+            mean=params['expected_return'],
+            std=params['volatility']
+        )
 
     # Without hustle
     no_hustle_params = params.copy()
     no_hustle_params['emergency_hustle'] = {'enabled': False}
-    results_without, summary_without = run_monte_carlo(no_hustle_params, all_returns=all_returns)
+    _, summary_without = run_monte_carlo(no_hustle_params, all_returns=all_returns)
 
     # With hustle
-    results_with, summary_with = run_monte_carlo(params, all_returns=all_returns)
+    batch_with, summary_with = run_monte_carlo(params, all_returns=all_returns)
 
-    # Calculate hustle activation stats
-    hustle_activations = sum(1 for r in results_with if r.hustle_activated)
-    activation_rate = hustle_activations / num_simulations
+    # Calculate hustle activation stats from the SoA columns
+    hustle_activations = int(batch_with.hustle_activated.sum())
+    activation_rate = hustle_activations / batch_with.num_paths
 
-    # Get average activation age
-    activation_ages = [r.hustle_activation_age for r in results_with if r.hustle_activation_age is not None]
-    avg_activation_age = sum(activation_ages) / len(activation_ages) if activation_ages else 0
+    # Get average activation age (-1 marks paths that never activated)
+    activation_ages = batch_with.hustle_activation_age[batch_with.hustle_activation_age >= 0]
+    avg_activation_age = float(activation_ages.mean()) if activation_ages.size else 0
 
     # Print comparison
     hustle = params.get('emergency_hustle', {})
@@ -302,7 +325,7 @@ def compare_with_hustle(params: dict, num_simulations: int = 1000):
 
     improvement = summary_with.success_rate - summary_without.success_rate
     print(f"\nHustle activation rate:   {activation_rate:.1%} of simulations")
-    if activation_ages:
+    if activation_ages.size:
         print(f"Average activation age:   {avg_activation_age:.1f}")
     print(f"\nSuccess rate improvement: {improvement:+.1%} percentage points")
 
@@ -371,26 +394,38 @@ def main():
     results = run_all_scenarios(params)
     print_scenario_comparison(results, params)
 
+    # One master return matrix shared by every Monte Carlo consumer below.
+    # Generating it once removes the redundant RNG work, and the paired
+    # samples make the floor search and the with/without comparisons
+    # answer "same markets, different plan" instead of comparing across
+    # independent noisy draws.
+    years = params['end_age'] - params['start_age']
+    master_returns = monte_carlo_returns(
+        years, 1000,
+        mean=params['expected_return'],
+        std=params['volatility']
+    )
+
     # Monte Carlo
     print("\nRunning Monte Carlo simulation (1000 runs)...")
-    _, mc_summary = run_monte_carlo(params, 1000)
+    _, mc_summary = run_monte_carlo(params, all_returns=master_returns)
     print_monte_carlo_summary(mc_summary, 1000)
 
     # Bulletproof floor
     print("\nCalculating bulletproof floor...")
-    floor = find_bulletproof_floor(params, 0.95, 500)
+    floor = find_bulletproof_floor(params, 0.95, all_returns=master_returns[:500])
     print_bulletproof_analysis(params, floor)
 
     # Windfall comparison
     if windfalls:
         print("\nComparing with/without windfalls...")
-        compare_with_windfalls(params, 500)
+        compare_with_windfalls(params, all_returns=master_returns[:500])
 
     # Emergency hustle comparison
     emergency_hustle = params.get('emergency_hustle', {})
     if emergency_hustle.get('enabled', False):
         print("\nComparing with/without emergency hustle...")
-        compare_with_hustle(params, 500)
+        compare_with_hustle(params, all_returns=master_returns[:500])
 
     print("\n" + "=" * 60)
     print("ANALYSIS COMPLETE")
@@ -6,10 +6,76 @@ and historical backtesting.
 """
 
 import json
-import random
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any
 
+import numpy as np
+
+# Shared generator (PCG64) for unseeded draws
+_rng = np.random.default_rng()
+
+
+# =============================================================================
+# DETERMINISTIC SCENARIOS
+# =============================================================================
+#
+# Pure functions of their arguments, so results are memoized - repeated
+# run_all_scenarios calls at the same horizon reuse the cached sequence
+# instead of rebuilding it. Returned as tuples: the cache hands the same
+# object to every caller, so it must be immutable.
+
+@lru_cache(maxsize=128)
+def baseline_returns(years: int, annual_return: float = 0.06) -> tuple:
+    """Steady growth at the expected return every year, no volatility."""
+    return (annual_return,) * years
+
+
+@lru_cache(maxsize=128)
+def crash_year_one(years: int, crash_size: float = -0.30,
+                   normal_return: float = 0.06) -> tuple:
+    """Market crashes immediately after retiring, then normal returns."""
+    return (crash_size,) + (normal_return,) * (years - 1)
+
+
+@lru_cache(maxsize=128)
+def lost_decade(years: int, bad_return: float = 0.0, bad_years: int = 10,
+                normal_return: float = 0.06) -> tuple:
+    """Zero real returns for the first decade, then normal growth."""
+    bad_years = min(bad_years, years)
+    return (bad_return,) * bad_years + (normal_return,) * (years - bad_years)
+
+
+@lru_cache(maxsize=128)
+def double_crash(years: int, crash_size: float = -0.30, gap_years: int = 7,
+                 normal_return: float = 0.06) -> tuple:
+    """Crash in year one and again a few years later, normal in between."""
+    sequence = [normal_return] * years
+    sequence[0] = crash_size
+    if gap_years < years:
+        sequence[gap_years] = crash_size
+    return tuple(sequence)
+
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    'baseline': {
+        'name': 'Baseline (steady 6%)',
+        'generator': baseline_returns,
+    },
+    'crash_year_one': {
+        'name': 'Crash in Year One',
+        'generator': crash_year_one,
+    },
+    'lost_decade': {
+        'name': 'Lost Decade',
+        'generator': lost_decade,
+    },
+    'double_crash': {
+        'name': 'Double Crash (Y1 + Y8)',
+        'generator': double_crash,
+    },
+}
+
 
 # =============================================================================
 # MONTE CARLO (RANDOM) RETURNS
@@ -18,15 +84,34 @@ from typing import List, Dict, Any
 def random_returns(years: int, mean: float = 0.06, std: float = 0.15,
                    seed: int = None) -> List[float]:
     """Generate random returns from a normal distribution."""
-    if seed is not None:
-        random.seed(seed)
-    return [random.gauss(mean, std) for _ in range(years)]
+    rng = np.random.default_rng(seed) if seed is not None else _rng
+    return (rng.standard_normal(years) * std + mean).tolist()
 
 
 def monte_carlo_returns(years: int, num_simulations: int = 1000,
-                        mean: float = 0.06, std: float = 0.15) -> List[List[float]]:
-    """Generate many random return sequences for Monte Carlo analysis."""
-    return [random_returns(years, mean, std) for _ in range(num_simulations)]
+                        mean: float = 0.06, std: float = 0.15,
+                        seed: int = None, antithetic: bool = False) -> np.ndarray:
+    """
+    Generate many random return sequences for Monte Carlo analysis.
+
+    One vectorized (num_simulations, years) draw instead of per-year
+    Python-level gauss calls; the matrix feeds run_simulation_batch
+    directly.
+
+    With antithetic=True, each drawn path is paired with its mirror
+    (z, -z), which halves the RNG work and reduces the variance of
+    success-rate and percentile estimates for the same number of paths -
+    the same accuracy needs roughly half the simulations.
+    """
+    rng = np.random.default_rng(seed) if seed is not None else _rng
+    if antithetic:
+        half = (num_simulations + 1) // 2
+        z = rng.standard_normal((half, years))
+        # Odd counts drop one mirrored row to keep the requested shape
+        z = np.concatenate([z, -z[:num_simulations - half]], axis=0)
+    else:
+        z = rng.standard_normal((num_simulations, years))
+    return z * std + mean
 
 
 # =============================================================================
@@ -34,6 +119,7 @@ def monte_carlo_returns(years: int, num_simulations: int = 1000,
 # =============================================================================
 
 _HISTORICAL_DATA = None
+_REAL_RETURNS_NP = None
 
 
 def load_historical_returns() -> Dict[str, Any]:
@@ -54,7 +140,21 @@ def load_historical_returns() -> Dict[str, Any]:
     return _HISTORICAL_DATA
 
 
-def historical_sequence_returns(years_needed: int) -> List[List[float]]:
+def get_real_returns_np() -> np.ndarray:
+    """
+    Real returns as a cached contiguous float64 array (~150 values, fits
+    in L1). Hot consumers use this instead of re-converting the JSON list
+    on every call; load_historical_returns keeps its dict API.
+    """
+    global _REAL_RETURNS_NP
+    if _REAL_RETURNS_NP is None:
+        _REAL_RETURNS_NP = np.ascontiguousarray(
+            load_historical_returns()['real_returns'], dtype=np.float64
+        )
+    return _REAL_RETURNS_NP
+
+
+def historical_sequence_returns(years_needed: int) -> np.ndarray:
     """
     Generate return sequences for historical backtesting.
 
@@ -66,21 +166,17 @@ def historical_sequence_returns(years_needed: int) -> List[List[float]]:
         years_needed: Number of years of returns needed (e.g., 48 for age 47→95)
 
     Returns:
-        List of return sequences, one per possible starting year.
-        Each sequence contains real (inflation-adjusted) returns.
+        (num_starting_years, years_needed) read-only float64 view, one row
+        per possible starting year, containing real (inflation-adjusted)
+        returns. The wrap-around is handled by tiling the data before
+        taking sliding windows, so no Python-level loop runs.
     """
-    data = load_historical_returns()
-    real_returns = data['real_returns']
-
-    sequences = []
-    for start_idx in range(len(real_returns)):
-        sequence = []
-        for i in range(years_needed):
-            idx = (start_idx + i) % len(real_returns)
-            sequence.append(real_returns[idx])
-        sequences.append(sequence)
-
-    return sequences
+    real = get_real_returns_np()
+    # Tile enough copies that every window fits, then slide a strided
+    # (zero-copy) view over it - one window per historical starting year
+    copies = 1 + (years_needed - 1) // len(real) + 1
+    tiled = np.tile(real, copies)
+    return np.lib.stride_tricks.sliding_window_view(tiled, years_needed)[:len(real)]
 
 
 def get_historical_years() -> List[int]:
@@ -0,0 +1,154 @@
+"""
+Numba-compiled simulation kernel.
+
+JIT-compiled per-path portfolio evolution for the Monte Carlo engine.
+Importing this module requires numba; fire_simulator falls back to the
+pure-NumPy batch loop when it is not installed.
+
+The kernel fuses the whole year loop into one scalar pass per path
+(parallelized with prange), so each path-year touches its data once
+instead of paying NumPy dispatch and temporary arrays per timestep.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def evolve_paths(
+    returns,                 # (num_paths, years) float64
+    starting_portfolio,
+    annual_expenses,
+    start_age,
+    income_schedule,         # (years,) inflation-adjusted income per year
+    windfall_schedule,       # (years,) windfall per year
+    inflation_multipliers,   # (years,) (1+inflation)^t, precomputed
+    hustle_enabled,
+    hustle_trigger_age_max,
+    hustle_threshold,
+    hustle_extra_income,
+    hustle_duration,
+    rules_enabled,
+    drop_threshold,
+    recovery_threshold,
+    lean_age,
+    reduced_spending,
+    lean_spending,
+):
+    """
+    Evolve all paths; mirrors the scalar run_simulation state machine.
+
+    Returns (portfolios, ruin_age, hustle_activated, hustle_activation_age,
+    spending_reduced, spending_went_lean, path_min, path_min_idx) as
+    arrays, one row/entry per path. The running minimum is tracked inside
+    the loop so close-call analysis never rescans the trajectory matrix.
+    """
+    num_paths, years = returns.shape
+
+    # Trajectory storage follows the returns dtype (float32 halves bandwidth)
+    portfolios = np.empty((num_paths, years + 1), dtype=returns.dtype)
+    ruin_age = np.full(num_paths, -1, dtype=np.int64)
+    hustle_activated = np.zeros(num_paths, dtype=np.bool_)
+    hustle_activation_age = np.full(num_paths, -1, dtype=np.int64)
+    spending_reduced = np.zeros(num_paths, dtype=np.bool_)
+    spending_went_lean = np.zeros(num_paths, dtype=np.bool_)
+    path_min = np.empty(num_paths, dtype=returns.dtype)
+    path_min_idx = np.zeros(num_paths, dtype=np.int64)
+
+    for i in prange(num_paths):
+        p = starting_portfolio
+        pmin = starting_portfolio
+        pmin_idx = 0
+        # Spending level in today's euros; actual expenses are
+        # expense_level * inflation_multipliers[t]
+        expense_level = annual_expenses
+        hustle_triggered = False
+        hustle_years_remaining = 0
+        spending_state = 0  # 0 = normal, 1 = reduced, 2 = lean
+
+        portfolios[i, 0] = p
+
+        for t in range(years):
+            current_age = start_age + t + 1
+            infl = inflation_multipliers[t]
+
+            p += windfall_schedule[t]
+            income = income_schedule[t]
+
+            if hustle_enabled:
+                if (not hustle_triggered
+                        and current_age <= hustle_trigger_age_max
+                        and p < hustle_threshold):
+                    hustle_triggered = True
+                    hustle_activated[i] = True
+                    hustle_activation_age[i] = current_age
+                    hustle_years_remaining = hustle_duration
+
+                if hustle_years_remaining > 0:
+                    income += hustle_extra_income * infl
+                    hustle_years_remaining -= 1
+
+            if rules_enabled and hustle_years_remaining == 0:
+                if p < drop_threshold:
+                    spending_state = 2 if current_age >= lean_age else 1
+                elif p >= recovery_threshold:
+                    spending_state = 0
+
+                if spending_state == 1:
+                    spending_reduced[i] = True
+                    expense_level = reduced_spending
+                elif spending_state == 2:
+                    spending_reduced[i] = True
+                    spending_went_lean[i] = True
+                    expense_level = lean_spending
+                else:
+                    expense_level = annual_expenses
+
+            net_withdrawal = expense_level * infl - income
+            if net_withdrawal < 0.0:
+                net_withdrawal = 0.0
+
+            p = p * (1.0 + returns[i, t]) - net_withdrawal
+
+            if p <= 0.0:
+                # Ruined: zero-fill the rest of the row and stop evolving
+                # this path (failures typically bust decades before T)
+                ruin_age[i] = current_age
+                for rest in range(t + 1, years + 1):
+                    portfolios[i, rest] = 0.0
+                if 0.0 < pmin:
+                    pmin = 0.0
+                    pmin_idx = t + 1
+                break
+
+            portfolios[i, t + 1] = p
+            if p < pmin:
+                pmin = p
+                pmin_idx = t + 1
+
+        path_min[i] = pmin
+        path_min_idx[i] = pmin_idx
+
+    return (portfolios, ruin_age, hustle_activated, hustle_activation_age,
+            spending_reduced, spending_went_lean, path_min, path_min_idx)
+
+
+def warmup():
+    """
+    Trigger kernel compilation for both storage dtypes.
+
+    cache=True persists the compiled code on disk, so after the first ever
+    call this only pays the cache load - servers call it at startup instead
+    of taxing the first request with the compile.
+    """
+    for dtype in (np.float32, np.float64):
+        # Schedules follow the returns dtype (run_simulation_batch casts
+        # them to match); inflation multipliers stay float64. The warmup
+        # args must mirror that exactly or the float32 signature compiled
+        # here is not the one real requests dispatch to.
+        evolve_paths(
+            np.zeros((1, 1), dtype=dtype), 1.0, 0.0, 50,
+            np.zeros(1, dtype=dtype), np.zeros(1, dtype=dtype), np.ones(1),
+            False, 0, 0.0, 0.0, 0,
+            False, 0.0, 0.0, 0, 0.0, 0.0,
+        )